@@ -0,0 +1,64 @@
+# ds18b20_read.py
+"""
+Microbenchmark of the Python overhead of one DS18B20 read.
+
+Compares the old open/readlines/split parsing with DS18B20Reader on fake sysfs
+files, so it runs anywhere and measures only the Python side of a read, not the
+sensor's conversion time.
+
+Run from the repository root:
+    python -m Benchmarks.ds18b20_read
+"""
+import os, sys, tempfile, timeit
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from Common.utils_rpi import DS18B20Reader
+
+SERIAL_CODE = "28-000000000000"
+W1_SLAVE = b"72 01 4b 46 7f ff 0e 10 57 : crc=57 YES\n72 01 4b 46 7f ff 0e 10 57 t=23125\n"
+TEMPERATURE = b"23125\n"
+ITERATIONS = 20000
+
+
+def read_legacy(sensor_file_path):
+    """The parsing read_ds18b20 did before DS18B20Reader."""
+    with open(sensor_file_path, 'r') as f:
+        lines = f.readlines()
+    if lines[0].strip()[-3:] != "YES":
+        raise ValueError("CRC check failed for DS18B20 data.")
+    temp_output = lines[1].split("t=")
+    return float(temp_output[1]) / 1000.0
+
+
+def per_read_us(statement):
+    return min(timeit.repeat(statement, number=ITERATIONS, repeat=5)) / ITERATIONS * 1e6
+
+
+def main():
+    with tempfile.TemporaryDirectory() as devices_dir:
+        sensor_dir = os.path.join(devices_dir, SERIAL_CODE)
+        os.makedirs(sensor_dir)
+        w1_slave_path = os.path.join(sensor_dir, "w1_slave")
+        with open(w1_slave_path, "wb") as f:
+            f.write(W1_SLAVE)
+
+        w1_slave_reader = DS18B20Reader(SERIAL_CODE, devices_dir)
+        legacy_us = per_read_us(lambda: read_legacy(w1_slave_path))
+        w1_slave_us = per_read_us(w1_slave_reader.read)
+
+        with open(os.path.join(sensor_dir, "temperature"), "wb") as f:
+            f.write(TEMPERATURE)
+        temperature_reader = DS18B20Reader(SERIAL_CODE, devices_dir)
+        temperature_us = per_read_us(temperature_reader.read)
+
+        assert read_legacy(w1_slave_path) == w1_slave_reader.read() == temperature_reader.read()
+        w1_slave_reader.close()
+        temperature_reader.close()
+
+    print(f"legacy open/readlines/split: {legacy_us:7.2f} us per read")
+    print(f"DS18B20Reader (w1_slave):    {w1_slave_us:7.2f} us per read")
+    print(f"DS18B20Reader (temperature): {temperature_us:7.2f} us per read")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# import_time.py
+"""
+Cold-start import-time report.
+
+Imports main.py in a fresh interpreter with `-X importtime` and reports the
+modules that dominate startup, the total import time, and any module that is
+meant to be loaded only after the first frame (voice assistant, audio, graph)
+but was imported at startup. Exits with status 1 when the total exceeds the
+budget or a deferred module shows up, so regressions are easy to spot.
+
+Run from the repository root:
+    python -m Benchmarks.import_time [--budget-ms 1500] [--top 15]
+"""
+import os, re, sys, argparse, subprocess
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Startup import budget in milliseconds, measured on the development PC; the Pi is several times slower
+IMPORT_BUDGET_MS = 1500
+
+# Packages that must not be imported before the first frame
+DEFERRED_MODULES = ("openai", "sounddevice", "vosk", "dotenv", "pygame", "pyqtgraph")
+
+LINE_PATTERN = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def measure(module="main"):
+    """
+    Import `module` in a fresh interpreter and parse the -X importtime output.
+
+    Returns:
+        list: (name, self_us, cumulative_us, depth) for every imported module, in import order.
+    """
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    modules = []
+    for line in result.stderr.splitlines():
+        match = LINE_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules.append((name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--module", default="main")
+    args = parser.parse_args()
+
+    modules = measure(args.module)
+    total_ms = sum(cumulative for _, _, cumulative, depth in modules if depth == 0) / 1000
+
+    # Depth 1 are the modules imported directly by the measured module (and by the interpreter's own startup)
+    print(f"Slowest direct imports of {args.module}:")
+    direct = sorted((m for m in modules if m[3] == 1), key=lambda m: m[2], reverse=True)
+    for name, _, cumulative_us, _ in direct[:args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+
+    print(f"\nTotal import time: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+
+    early = sorted({name.split(".")[0] for name, *_ in modules if name.split(".")[0] in DEFERRED_MODULES})
+    if early:
+        print("Imported before the first frame, but should be deferred:")
+        for name in early:
+            print(f"  {name}")
+
+    if total_ms > args.budget_ms or early:
+        print("FAIL")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
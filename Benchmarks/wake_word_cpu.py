@@ -0,0 +1,87 @@
+# wake_word_cpu.py
+"""
+CPU cost of wake-word detection per second of microphone audio.
+
+Feeds the same audio through the recognizer the way KeywordDetector used to
+(44.1 kHz blocks into a 44.1 kHz KaldiRecognizer, which resamples internally)
+and the way it does now (16 kHz from the capture hub, resampled by
+PolyphaseResampler when the microphone cannot open at 16 kHz), and reports the
+process CPU time of each as a percentage of one core. Uses a WAV file if one is
+given, otherwise synthetic speech-like audio. Without vosk installed only the
+resampler is measured.
+
+Run from the repository root:
+    python -m Benchmarks.wake_word_cpu [--wav recording.wav] [--seconds 20]
+"""
+import os, sys, time, wave, argparse
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from ChatGPT_API.resampler import PolyphaseResampler
+from ChatGPT_API.capture_hub import CAPTURE_BLOCK_SIZE, TARGET_SAMPLE_RATE
+
+MODEL_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "ChatGPT_API", "vosk-model-small-en-us-0.15"))
+DEVICE_SAMPLE_RATE = 44100
+
+
+def load_audio(path, seconds):
+    """Return `seconds` of int16 mono audio at DEVICE_SAMPLE_RATE, from a WAV file or synthesised."""
+    if path:
+        with wave.open(path, "rb") as wf:
+            if wf.getframerate() != DEVICE_SAMPLE_RATE or wf.getnchannels() != 1 or wf.getsampwidth() != 2:
+                raise SystemExit(f"{path} must be 16-bit mono at {DEVICE_SAMPLE_RATE} Hz")
+            audio = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+        return np.resize(audio, int(seconds * DEVICE_SAMPLE_RATE))
+
+    # Voiced harmonics with a syllable-rate envelope over background noise
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * DEVICE_SAMPLE_RATE)) / DEVICE_SAMPLE_RATE
+    voice = sum(3000 / k * np.sin(2 * np.pi * 140 * k * t) for k in range(1, 8))
+    audio = (0.5 + 0.5 * np.sin(2 * np.pi * 3 * t)) * voice + rng.normal(0, 300, len(t))
+    return np.clip(audio, -32768, 32767).astype(np.int16)
+
+
+def cpu_percent(process_block, audio, seconds):
+    """Feed `audio` in capture-sized blocks and return the CPU time used as a percentage of the audio duration."""
+    start = time.process_time()
+    for i in range(0, len(audio), CAPTURE_BLOCK_SIZE):
+        process_block(audio[i:i + CAPTURE_BLOCK_SIZE])
+    return (time.process_time() - start) / seconds * 100
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--wav", help=f"16-bit mono WAV at {DEVICE_SAMPLE_RATE} Hz")
+    parser.add_argument("--seconds", type=float, default=20)
+    parser.add_argument("--model", default=MODEL_PATH)
+    args = parser.parse_args()
+
+    audio = load_audio(args.wav, args.seconds)
+    print(f"{args.seconds:.0f} s of {'recorded' if args.wav else 'synthetic'} audio, {CAPTURE_BLOCK_SIZE}-sample blocks")
+
+    resampler = PolyphaseResampler(DEVICE_SAMPLE_RATE, TARGET_SAMPLE_RATE)
+    resample_cpu = cpu_percent(resampler.process, audio, args.seconds)
+    print(f"  Resampler {DEVICE_SAMPLE_RATE} -> {TARGET_SAMPLE_RATE} Hz:       {resample_cpu:6.2f} % of one core")
+
+    try:
+        from vosk import Model, KaldiRecognizer, SetLogLevel
+    except ImportError:
+        print("vosk is not installed; recognizer CPU not measured.")
+        return
+    SetLogLevel(-1)
+    model = Model(args.model)
+
+    before = KaldiRecognizer(model, DEVICE_SAMPLE_RATE)
+    before_cpu = cpu_percent(lambda block: before.AcceptWaveform(block.tobytes()), audio, args.seconds)
+
+    resampled = PolyphaseResampler(DEVICE_SAMPLE_RATE, TARGET_SAMPLE_RATE).process(audio)
+    after = KaldiRecognizer(model, TARGET_SAMPLE_RATE)
+    after_cpu = cpu_percent(lambda block: after.AcceptWaveform(block.tobytes()), resampled, args.seconds)
+
+    print(f"  Before: recognizer at {DEVICE_SAMPLE_RATE} Hz:          {before_cpu:6.2f} % of one core")
+    print(f"  After:  recognizer at {TARGET_SAMPLE_RATE} Hz:          {after_cpu:6.2f} % of one core")
+    print(f"  After, when the mic cannot open at {TARGET_SAMPLE_RATE} Hz:  {after_cpu + resample_cpu:6.2f} % of one core (with resampler)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,30 @@
-import json, time, pygame, wave, sys, os
+import json, time, wave, sys, os
+from functools import lru_cache
 from openai import OpenAI
 from pathlib import Path
-import sounddevice as sd
 import numpy as np
 from dotenv import dotenv_values
 from ChatGPT_API import assistant_functions
 from Common.detector_signals import detector_signals
-from Common.config import IS_RPI
+from Common.sound_service import sound_service
+from ChatGPT_API.capture_hub import capture_hub
+from ChatGPT_API.voice_activity import VoiceActivityDetector, FRAME_MS
+from Common.settings_store import settings_store
 
-config = dotenv_values("api_info.env")
-os.environ["OPENAI_API_KEY"] = config["OPENAI_API_KEY"]
-os.environ["OPENAI_ASSISTANT_ID"] = config["OPENAI_ASSISTANT_ID"]
+@lru_cache(maxsize=None)
+def load_api_config():
+    """
+    Reads the OpenAI credentials from api_info.env the first time they are needed, instead of when the module is imported.
+
+    Returns:
+    tuple: (api_key, assistant_id)
+    """
+    config = dotenv_values("api_info.env")
+    os.environ["OPENAI_API_KEY"] = config["OPENAI_API_KEY"]
+    os.environ["OPENAI_ASSISTANT_ID"] = config["OPENAI_ASSISTANT_ID"]
 
-# Retrieve them again
-api_key = os.getenv("OPENAI_API_KEY")
-assistant_id = os.getenv("OPENAI_ASSISTANT_ID")
+    # Retrieve them again
+    return os.getenv("OPENAI_API_KEY"), os.getenv("OPENAI_ASSISTANT_ID")
 
 try:
     import Common.variables as variables
@@ -23,71 +33,63 @@ try:
 except:
     pass
 
-def record_audio(filename, sample_rate=44100, silence_threshold=500, silence_duration=1.5):
+voice_activity_detector = None  # Created for the capture sample rate on the first query
+
+def get_voice_activity_detector(sample_rate):
+    """Return the recorder's voice activity detector, keeping its noise floor from one query to the next."""
+    global voice_activity_detector
+    if voice_activity_detector is None or voice_activity_detector.frame_length != int(sample_rate * FRAME_MS / 1000):
+        voice_activity_detector = VoiceActivityDetector(sample_rate)
+    # The thresholds are read on every query, so they can be tuned in settings.json while running
+    voice_activity_detector.set_thresholds(
+        settings_store.get("vad_margin", 9.0, cast=float),
+        settings_store.get("vad_end_silence", 400, cast=float)
+    )
+    voice_activity_detector.reset()
+    return voice_activity_detector
+
+def record_audio(filename, start_position=None, max_wait_seconds=1.5, max_duration=30):
     """
-    Records audio until speech is detected, then stops after `silence_duration` seconds of trailing silence.
+    Records audio until speech is detected, then stops once the voice activity detector reports the end of the utterance.
     Saves the .wav file and returns whether speech was detected.
+
+    Reads the shared microphone stream, so no device is opened and no audio is lost between turns.
+    `start_position` is a capture_hub sample position to start from; it defaults to now.
     """
     print("Recording (GPT)...")
     detector_signals.bruce_listening.emit()
 
-    duration_per_chunk = 0.5  # seconds per chunk
-    chunk_samples = int(sample_rate * duration_per_chunk)
+    sample_rate = capture_hub.start()
+    reader = capture_hub.reader(start_position)
+    vad = get_voice_activity_detector(sample_rate)
 
-    silence_chunks = int(silence_duration / duration_per_chunk)
-    max_wait_seconds = 1.5
+    duration_per_chunk = 0.1  # seconds per chunk; the end of speech is noticed at most this much late
+    chunk_samples = int(sample_rate * duration_per_chunk)
     max_chunks_no_speech = int(max_wait_seconds / duration_per_chunk)
+    max_chunks = int(max_duration / duration_per_chunk)
 
-    silence_counter = 0
     audio_buffer = []
-    speech_detected = False
-    chunks_without_speech = 0
-
-    # Set the correct audio device and sample rate for Raspberry Pi
-    if IS_RPI:
-        device_index = 2  # Use USB mic on RPi
-        try:
-            print(f"Using Raspberry Pi microphone: Device {device_index} with {sample_rate} Hz")
-            test_stream = sd.InputStream(device=device_index, samplerate=sample_rate, channels=1, dtype='int16')
-            test_stream.close()
-        except Exception as e:
-            print(f"44100 Hz not supported, switching to 8000 Hz: {e}")
-            sample_rate = 8000  # Use a lower sample rate if needed
-
-    else:
-        device_index = None  # Use default device on PC
-        print(f"Using default microphone with {sample_rate} Hz")
 
     try:
-        while True:
-            # Start recording
-            audio_chunk = sd.rec(chunk_samples, samplerate=sample_rate, 
-                                 channels=1, dtype='int16', device=device_index)
-            sd.wait()
-
-            chunk_float = audio_chunk.astype(np.float32)
-            rms = np.sqrt(np.mean(chunk_float**2))
-
-            print(f"Chunk RMS: {rms} - Silence Threshold: {silence_threshold}")
+        while len(audio_buffer) < max_chunks:
+            # Take the next chunk from the shared stream
+            audio_chunk = reader.read(chunk_samples, timeout=1.0)
+            if len(audio_chunk) < chunk_samples:
+                print("Microphone stream stopped. Stopping recording.")
+                break
             audio_buffer.append(audio_chunk)
 
-            if rms >= silence_threshold:
-                speech_detected = True
-                chunks_without_speech = 0
-                silence_counter = 0
-            else:
-                if not speech_detected:
-                    chunks_without_speech += 1
-                    if chunks_without_speech >= max_chunks_no_speech:
-                        print("No speech detected at all. Stopping.")
-                        break
-                else:
-                    silence_counter += 1
-
-            if speech_detected and silence_counter >= silence_chunks:
-                print("Silence detected after speech. Stopping recording.")
+            if vad.process(audio_chunk):
+                print(f"End of speech detected after {vad.silence_ms()} ms of silence. Stopping recording.")
+                break
+            if not vad.speech_started and len(audio_buffer) >= max_chunks_no_speech:
+                print("No speech detected at all. Stopping.")
                 break
 
+        speech_detected = vad.speech_started
+        if not audio_buffer:
+            return False
+
         # Save the recording
         audio_data = np.concatenate(audio_buffer, axis=0)
         with wave.open(filename, "wb") as wf:
@@ -110,6 +112,7 @@ def speech_to_text(audio_file_path , thread_id = None):
     Returns None if no valid speech is detected.
     """
     try:
+        api_key, _ = load_api_config()
         openai_client = OpenAI(api_key=api_key)
 
         # Open the audio file in binary mode
@@ -172,14 +175,14 @@ def text_to_speech(input_text):
     """
     start_time = time.time()  # Start timing
     try:
+        api_key, _ = load_api_config()
         openai_client = OpenAI(api_key=api_key)
 
         speech_file_path = Path(__file__).parent / "speech.mp3"
 
-        # Remove the file if it already exists and isn't in use
+        # Remove the file if it already exists; the previous speech was decoded into memory, so it is not in use
         if speech_file_path.exists():
             try:
-                pygame.mixer.quit()  # Ensure the file is not locked by pygame
                 speech_file_path.unlink()
             except Exception as e:
                 print(f"Error deleting existing file: {e}")
@@ -196,22 +199,16 @@ def text_to_speech(input_text):
         end_time = time.time()  # Stop timing as soon as the file is ready
         print(f"text_to_speech() processing time: {end_time - start_time:.2f} seconds.")
 
-        # Initialize the mixer before playback
-        pygame.mixer.init()
-        pygame.mixer.music.load(str(speech_file_path))
+        # Mix the speech with the alert sounds on the shared output, and wait for its end event
+        playback = sound_service.say(speech_file_path)
         detector_signals.bruce_responding.emit()
-        pygame.mixer.music.play()
-
-        while pygame.mixer.music.get_busy():
-            pygame.time.Clock().tick(10)
-
-        # Quit the mixer after playback is complete
-        pygame.mixer.quit()
+        playback.wait()
     except Exception as e:
         print(f"Error in text_to_speech: {e}")
 
 def assistant_ai(conversation):
     try:
+        api_key, assistant_id = load_api_config()
         openai_client = OpenAI(api_key=api_key)
         detector_signals.bruce_loading.emit()
         thread = openai_client.beta.threads.create(messages=conversation)
@@ -1,11 +1,9 @@
 import os
 import json
 import threading
-import time
-import sounddevice as sd
 from vosk import Model, KaldiRecognizer
-from Common.config import IS_RPI
 from ChatGPT_API.ChatGPT_Assistant import call_ai_assistant, text_to_speech
+from ChatGPT_API.capture_hub import capture_hub
 from Common.utils import play_audio
 from Common.detector_signals import detector_signals
 
@@ -14,12 +12,14 @@ try:
 except ImportError:
     variables = None
 
+DETECTION_BLOCK_SECONDS = 0.1  # Audio fed to the recognizer per step
+
 class KeywordDetector:
     def __init__(self, model_path, keywords, sample_rate=44100):
         self.model_path = model_path
         self.keywords = keywords
         self.sample_rate = sample_rate
-        self.model = self.load_model()
+        self.model = None  # Loaded on the detection thread, so constructing the detector never blocks the GUI
         self.running = threading.Event()
         self.running.set()
         self.thread = None
@@ -36,15 +36,9 @@ class KeywordDetector:
         print("Model loaded successfully.")
         return model
 
-    def detection_callback(self, indata, frames, time_info, status, recognizer):
-        if variables and variables.talking_with_chat:
-            return
-
-        if status:
-            print(f"Status: {status}")
-
-        audio_bytes = indata.tobytes()
-        if recognizer.AcceptWaveform(audio_bytes):
+    def process_block(self, samples, recognizer):
+        """Feed one block of microphone samples to the recognizer and flag a detected keyword."""
+        if recognizer.AcceptWaveform(samples.tobytes()):
             result = recognizer.Result()
             try:
                 result_dict = json.loads(result)
@@ -64,29 +58,34 @@ class KeywordDetector:
                     break
 
     def keyword_detection_loop(self):
+        try:
+            if self.model is None:
+                self.model = self.load_model()
+            # The microphone stays open from here on; the recorder reads the same stream
+            self.sample_rate = capture_hub.start()
+        except Exception as e:
+            print(f"Voice detection disabled, the Vosk model or the microphone could not be loaded: {e}")
+            return
+
+        reader = capture_hub.reader()
+        if not detector_signals.is_voice_ready:
+            # The stream is open, so the wake word can be heard from now on
+            detector_signals.is_voice_ready = True
+            detector_signals.voice_ready.emit()
+
+        block_size = int(self.sample_rate * DETECTION_BLOCK_SECONDS)
         while self.running.is_set():
             print("Starting detection cycle.")
             recognizer = KaldiRecognizer(self.model, self.sample_rate)
 
-            def stream_callback(indata, frames, time_info, status):
-                self.detection_callback(indata, frames, time_info, status, recognizer)
-
-            stream_kwargs = {
-                "samplerate": self.sample_rate,
-                "channels": 1,
-                "dtype": 'int16',
-                "callback": stream_callback
-            }
-            if IS_RPI:
-                stream_kwargs["device"] = 2
-
-            # Open the audio stream for this cycle
-            with sd.InputStream(**stream_kwargs):
-                # Run until a keyword is detected (or detection is stopped)
-                while self.running.is_set() and not self.keyword_detected.is_set():
-                    time.sleep(0.1)
-
-            # At this point, the stream is closed so the microphone is freed.
+            # Run until a keyword is detected (or detection is stopped)
+            while self.running.is_set() and not self.keyword_detected.is_set():
+                samples = reader.read(block_size, timeout=0.5)
+                if variables and variables.talking_with_chat:
+                    continue
+                if len(samples):
+                    self.process_block(samples, recognizer)
+
             if self.keyword_detected.is_set():
                 with self.ai_call_lock:
                     if variables and not variables.talking_with_chat:
@@ -99,13 +98,15 @@ class KeywordDetector:
 
                 # Reset the flag to allow future detection cycles.
                 self.keyword_detected.clear()
-            # Optionally, add a short sleep to avoid a rapid restart
-            time.sleep(0.2)
+
+            # Listen for the wake word again from now on, not in the conversation that was just held
+            reader.skip_to_now()
 
 
     def start_detection(self, callback=None):
         """
-        Starts the keyword detection loop on a single thread.
+        Starts the keyword detection loop on a single thread. The Vosk model is loaded on that
+        thread, and detector_signals.voice_ready is emitted once the microphone stream is live.
         
         :param callback: Optional callback function that gets called with (keyword, thread_id).
         """
@@ -0,0 +1,181 @@
+# capture_hub.py
+import threading
+import numpy as np
+from Common.config import IS_RPI
+from ChatGPT_API.resampler import PolyphaseResampler
+
+CAPTURE_DEVICE = 2 if IS_RPI else None  # USB mic on RPi, default device on PC
+CAPTURE_SAMPLE_RATES = (16000, 44100, 48000, 8000)  # Device rates tried in order; some USB mics on the RPi only open at 8000 Hz
+TARGET_SAMPLE_RATE = 16000  # Rate of the ring; the Vosk model and Whisper both work at 16 kHz, so higher device rates are resampled
+CAPTURE_BLOCK_SIZE = 1024  # Samples per PortAudio callback
+RING_SECONDS = 30  # A reader that falls further behind than this loses the oldest audio
+
+
+class CaptureHub:
+    """
+    One microphone stream, shared by every part of the voice assistant.
+
+    The input stream is opened once and stays open. Its callback copies each block
+    into a ring buffer and advances the write position; that is the only writer.
+    Each consumer (the wake-word recognizer, the utterance recorder, ...) reads
+    through its own RingReader cursor, so consumers never wait for each other and
+    handing the microphone from one to the next neither reopens the device nor
+    loses the samples in between.
+
+    The ring always holds TARGET_SAMPLE_RATE audio when the device can deliver
+    at least that. The device is asked for it first; if it only offers a higher
+    rate, the callback converts each block with a polyphase resampler, so the
+    recognizer gets the rate its model was trained on and the resampling is done
+    once for every consumer.
+
+    The ring itself takes no lock: the writer publishes a block by advancing
+    `position` after copying it. Because the block being copied in is not
+    published yet, a reader stays at least `max_block` samples (the largest block
+    the writer can copy) inside the ring, and checks after copying that it still
+    is, so neither the published blocks nor the one in flight can overlap what it
+    read. A condition is only used to wake readers that wait for more audio.
+    """
+    def __init__(self, device=CAPTURE_DEVICE, sample_rates=CAPTURE_SAMPLE_RATES, block_size=CAPTURE_BLOCK_SIZE, ring_seconds=RING_SECONDS):
+        self.device = device
+        self.sample_rates = sample_rates
+        self.block_size = block_size
+        self.ring_seconds = ring_seconds
+        self.device_sample_rate = None  # Rate the device was opened at
+        self.sample_rate = None  # Rate of the audio in the ring, set when the stream opens
+        self.resampler = None  # Converts device audio to the ring rate when they differ
+        self.buffer = None
+        self.capacity = 0
+        self.max_block = 0  # Largest block write() is given, after resampling
+        self.position = 0  # Total samples written since the stream opened
+        self.stream = None
+        self.lock = threading.Lock()  # Guards opening and closing the stream
+        self.data_ready = threading.Condition()
+
+    def start(self):
+        """Open the input stream if it is not open yet. Returns the sample rate of the audio in the ring."""
+        import sounddevice as sd
+        with self.lock:
+            if self.stream is not None:
+                return self.sample_rate
+
+            for device_sample_rate in self.sample_rates:
+                try:
+                    sd.check_input_settings(device=self.device, samplerate=device_sample_rate, channels=1, dtype='int16')
+                except Exception as e:
+                    print(f"Microphone does not support {device_sample_rate} Hz: {e}")
+                    continue
+
+                sample_rate = min(device_sample_rate, TARGET_SAMPLE_RATE)
+                self.resampler = PolyphaseResampler(device_sample_rate, sample_rate) if device_sample_rate != sample_rate else None
+                self.capacity = int(sample_rate * self.ring_seconds)
+                self.max_block = -(-self.block_size * sample_rate // device_sample_rate) + 1  # A resampled block may carry one extra sample
+                self.buffer = np.zeros(self.capacity, dtype=np.int16)
+                try:
+                    stream = sd.InputStream(
+                        device=self.device, samplerate=device_sample_rate, channels=1, dtype='int16',
+                        blocksize=self.block_size, callback=self.stream_callback
+                    )
+                except Exception as e:
+                    print(f"Microphone does not open at {device_sample_rate} Hz: {e}")
+                    continue
+                self.device_sample_rate, self.sample_rate = device_sample_rate, sample_rate
+                stream.start()
+                self.stream = stream
+                resampling = f", resampled to {sample_rate} Hz" if self.resampler else ""
+                print(f"Microphone capture running at {device_sample_rate} Hz{resampling}")
+                return sample_rate
+
+            raise RuntimeError("Could not open the microphone at any supported sample rate")
+
+    def stop(self):
+        with self.lock:
+            if self.stream is not None:
+                self.stream.close()
+                self.stream = None
+        with self.data_ready:
+            self.data_ready.notify_all()
+
+    @property
+    def running(self):
+        return self.stream is not None
+
+    def stream_callback(self, indata, frames, time_info, status):
+        if status:
+            print(f"Capture status: {status}")
+        samples = indata[:, 0]
+        self.write(self.resampler.process(samples) if self.resampler else samples)
+
+    def write(self, samples):
+        """Append samples to the ring. Only the stream callback calls this."""
+        position = self.position
+        if len(samples) > self.capacity:
+            position += len(samples) - self.capacity
+            samples = samples[-self.capacity:]
+
+        start = position % self.capacity
+        first = min(len(samples), self.capacity - start)
+        self.buffer[start:start + first] = samples[:first]
+        self.buffer[:len(samples) - first] = samples[first:]
+        self.position = position + len(samples)  # Publish the block
+
+        with self.data_ready:
+            self.data_ready.notify_all()
+
+    def reader(self, start=None):
+        """
+        Return a new consumer cursor.
+
+        Parameters:
+        - start (int): Absolute sample position to read from, e.g. a position saved earlier. Defaults to now.
+        """
+        self.start()
+        return RingReader(self, self.position if start is None else start)
+
+
+class RingReader:
+    """A consumer's cursor into the CaptureHub ring."""
+    def __init__(self, hub, cursor):
+        self.hub = hub
+        self.cursor = cursor
+        self.dropped = 0  # Samples lost because this reader fell too far behind the writer
+
+    def available(self):
+        return self.hub.position - self.cursor
+
+    def skip_to_now(self):
+        """Drop everything not read yet, e.g. audio that was captured while the consumer was busy."""
+        self.cursor = self.hub.position
+
+    def read(self, count, timeout=None):
+        """
+        Read the next `count` samples, waiting until they have been captured.
+
+        Returns:
+        numpy.ndarray: int16 samples. Shorter than `count` if the timeout passed or the stream was stopped first.
+        """
+        hub = self.hub
+        with hub.data_ready:
+            hub.data_ready.wait_for(lambda: self.available() >= count or not hub.running, timeout)
+
+        while True:
+            position = hub.position
+            oldest = position - hub.capacity + hub.max_block  # Oldest sample the next block cannot overwrite
+            if self.cursor < oldest:
+                # About to be lapped by the writer; skip to the oldest audio that is safe to read
+                self.dropped += oldest - self.cursor
+                self.cursor = oldest
+
+            size = min(count, position - self.cursor)
+            start = self.cursor % hub.capacity
+            first = min(size, hub.capacity - start)
+            samples = np.concatenate((hub.buffer[start:start + first], hub.buffer[:size - first]))
+
+            # The writer may have published blocks and started on the next one meanwhile; if that
+            # reached the start of the copy, copy again from further on
+            if hub.position + hub.max_block - self.cursor <= hub.capacity:
+                self.cursor += size
+                return samples
+
+
+# Create ONE global instance that can be imported
+capture_hub = CaptureHub()
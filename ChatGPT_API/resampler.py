@@ -0,0 +1,64 @@
+# resampler.py
+from math import gcd
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+ZERO_CROSSINGS = 10  # Sinc lobes on each side of the filter centre; more give a sharper anti-aliasing cutoff
+KAISER_BETA = 6.0  # About 60 dB stopband attenuation
+
+
+class PolyphaseResampler:
+    """
+    Streaming rational resampler, e.g. 44100 Hz to 16000 Hz (up 160, down 441).
+
+    The anti-aliasing low-pass filter is split into `up` phases once. Each output
+    sample is then one dot product of `taps_per_phase` input samples with the phase
+    it falls on, so the zero-stuffed signal is never built and a whole block is
+    computed with one gather and one einsum. The last input samples and the
+    fractional position are carried between blocks, so consecutive blocks join
+    without clicks.
+    """
+    def __init__(self, input_rate, output_rate, zero_crossings=ZERO_CROSSINGS):
+        divisor = gcd(input_rate, output_rate)
+        self.up = output_rate // divisor
+        self.down = input_rate // divisor
+
+        # Windowed-sinc low-pass at the lower of the two Nyquist frequencies, designed at the upsampled rate.
+        # Its length is set by the lower rate, so it is padded up to a whole number of taps per phase.
+        taps_per_phase = -(-2 * zero_crossings * max(self.up, self.down) // self.up)
+        self.taps_per_phase = taps_per_phase
+        length = self.up * taps_per_phase
+        cutoff = 1.0 / max(self.up, self.down)  # Fraction of the upsampled Nyquist frequency
+        n = np.arange(length) - (length - 1) / 2
+        taps = self.up * cutoff * np.sinc(cutoff * n) * np.kaiser(length, KAISER_BETA)
+
+        # Row p holds the taps of phase p, reversed so they line up with input samples in time order
+        self.phases = taps.reshape(taps_per_phase, self.up).T[:, ::-1].astype(np.float32)
+
+        self.history = np.zeros(taps_per_phase - 1, dtype=np.float32)  # Input carried over from the previous block
+        self.position = 0  # Position of the next output sample on the upsampled time axis, relative to the block start
+
+    def process(self, samples):
+        """
+        Resample the next block of samples.
+
+        Returns:
+        numpy.ndarray: The output samples this block completes, as int16 if the input was int16, otherwise float32.
+        """
+        signal = np.concatenate((self.history, samples.astype(np.float32)))
+        available = len(samples) * self.up  # Upsampled length of the new block
+
+        # Upsampled positions of the outputs that fall in this block, their input sample and phase
+        positions = np.arange(self.position, available, self.down)
+        base = positions // self.up
+        phase = positions % self.up
+
+        windows = sliding_window_view(signal, self.taps_per_phase)[base]
+        output = np.einsum('ij,ij->i', windows, self.phases[phase])
+
+        self.position = (positions[-1] + self.down - available) if len(positions) else self.position - available
+        self.history = signal[len(signal) - (self.taps_per_phase - 1):]
+
+        if samples.dtype == np.int16:
+            return np.clip(np.rint(output), -32768, 32767).astype(np.int16)
+        return output.astype(np.float32)
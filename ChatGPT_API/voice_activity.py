@@ -0,0 +1,116 @@
+# voice_activity.py
+import numpy as np
+
+FRAME_MS = 20  # Frame length; speech is roughly stationary over 10-30 ms
+START_FRAMES = 3  # Consecutive speech frames that start an utterance, so a click or clank does not
+MAX_SPEECH_ZCR = 0.35  # Fraction of sign changes per sample above which a frame is hiss, not voice
+FLOOR_RISE = 0.02  # How fast the noise floor follows louder background (per frame)
+FLOOR_FALL = 0.2  # How fast it follows quieter background (per frame)
+SPEECH_FLOOR_RISE = 0.002  # Creep during speech frames, so a pump switching on is absorbed after a few seconds
+INITIAL_FLOOR_FRAMES = 10  # Frames used to seed the noise floor
+
+
+class VoiceActivityDetector:
+    """
+    Frame-level voice activity detection for the utterance recorder.
+
+    Audio is cut into short frames. For each frame the energy (in dB) and the
+    zero-crossing rate are computed for a whole block at once with numpy. A frame
+    counts as speech when its energy is `margin_db` above the background noise
+    floor and its zero-crossing rate is low enough to rule out hiss. The noise
+    floor follows the background during non-speech frames (and creeps up slowly
+    during speech), so steady noise such as running pumps raises the bar instead
+    of being mistaken for speech.
+
+    An utterance starts after START_FRAMES speech frames in a row and ends after
+    `end_silence_ms` without speech, so the end is detected that long after the
+    speaker stops, plus at most one frame.
+    """
+    def __init__(self, sample_rate, margin_db=9.0, end_silence_ms=400, frame_ms=FRAME_MS):
+        """
+        Parameters:
+        - sample_rate (int): Sample rate of the audio that will be passed in.
+        - margin_db (float): How far above the noise floor a frame must be to count as speech.
+        - end_silence_ms (int): Silence after speech that ends the utterance.
+        - frame_ms (int): Frame length in milliseconds.
+        """
+        self.frame_length = max(1, int(sample_rate * frame_ms / 1000))
+        self.frame_ms = frame_ms
+        self.set_thresholds(margin_db, end_silence_ms)
+        self.noise_floor = None  # dB, kept across utterances
+        self.seed = []  # Frame energies collected to seed the noise floor
+        self.reset()
+
+    def set_thresholds(self, margin_db, end_silence_ms):
+        self.margin_db = margin_db
+        self.end_silence_frames = max(1, int(round(end_silence_ms / self.frame_ms)))
+
+    def reset(self):
+        """Prepare for a new utterance. The noise floor is kept, it still describes the room."""
+        self.remainder = np.zeros(0, dtype=np.int16)  # Samples short of a full frame, carried to the next call
+        self.speech_run = 0
+        self.silence_run = 0
+        self.speech_started = False
+        self.utterance_ended = False
+
+    def frame_features(self, samples):
+        """
+        Split samples into whole frames and return their energy and zero-crossing rate.
+
+        Returns:
+        tuple: (energy_db, zcr) arrays with one value per frame.
+        """
+        count = len(samples) // self.frame_length
+        frames = samples[:count * self.frame_length].astype(np.float32).reshape(count, self.frame_length)
+        energy_db = 10 * np.log10(np.mean(frames * frames, axis=1) + 1.0)
+        signs = np.signbit(frames)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / self.frame_length
+        return energy_db, zcr
+
+    def process(self, samples):
+        """
+        Feed the next block of int16 samples.
+
+        Returns:
+        bool: Whether the utterance has ended. `speech_started` tells whether it ever started.
+        """
+        samples = np.concatenate((self.remainder, samples))
+        whole = len(samples) - len(samples) % self.frame_length
+        self.remainder = samples[whole:]
+        if whole == 0:
+            return self.utterance_ended
+
+        energy_db, zcr = self.frame_features(samples[:whole])
+        for energy, crossings in zip(energy_db, zcr):
+            if self.noise_floor is None:
+                self.seed.append(energy)
+                if len(self.seed) < INITIAL_FLOOR_FRAMES:
+                    continue
+                self.noise_floor = float(np.percentile(self.seed, 20))  # Robust to a word in the first frames
+
+            is_speech = energy > self.noise_floor + self.margin_db and crossings < MAX_SPEECH_ZCR
+            if is_speech:
+                rate = SPEECH_FLOOR_RISE
+            else:
+                rate = FLOOR_RISE if energy > self.noise_floor else FLOOR_FALL
+            self.noise_floor += rate * (energy - self.noise_floor)
+            self.update_state(is_speech)
+        return self.utterance_ended
+
+    def update_state(self, is_speech):
+        if self.utterance_ended:
+            return
+        if is_speech:
+            self.speech_run += 1
+            self.silence_run = 0
+            if self.speech_run >= START_FRAMES:
+                self.speech_started = True
+        else:
+            self.speech_run = 0
+            self.silence_run += 1
+            if self.speech_started and self.silence_run >= self.end_silence_frames:
+                self.utterance_ended = True
+
+    def silence_ms(self):
+        """Time since the last speech frame."""
+        return self.silence_run * self.frame_ms
@@ -0,0 +1,155 @@
+# BrewLog.py
+import os, struct, time, mmap
+import numpy as np
+
+# File layout: a fixed header followed by fixed-width little-endian records
+LOG_MAGIC = b"BREWLOG1"
+HEADER_FORMAT = struct.Struct("<8sd")  # magic, wall-clock session start (epoch seconds)
+RECORD_FORMAT = struct.Struct("<d9fB")
+RECORD_DTYPE = np.dtype([
+    ("time", "<f8"),           # Seconds since the session started
+    ("temp_bk", "<f4"),
+    ("temp_mlt", "<f4"),
+    ("temp_hlt", "<f4"),
+    ("temp_reg_bk", "<f4"),
+    ("temp_reg_hlt", "<f4"),
+    ("efficiency_bk", "<f4"),
+    ("efficiency_hlt", "<f4"),
+    ("pump_speed_p1", "<f4"),
+    ("pump_speed_p2", "<f4"),
+    ("state", "u1"),           # Bit mask of STATE_BITS
+])
+
+# Bit positions of the on/off flags packed into the state field
+STATE_BITS = {"BK_ON": 0, "HLT_ON": 1, "P1_ON": 2, "P2_ON": 3}
+
+LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "BrewLogs"))
+CURRENT_SESSION_FILE = os.path.join(LOG_DIR, "current_session.brewlog")
+
+
+class BrewLog:
+    """
+    Crash-safe, append-only binary log of the brew session.
+
+    Records are buffered in memory and written and fsynced in batches every
+    flush_interval seconds, so at most one interval is lost on a crash. If the
+    current session file was written to within resume_window seconds, it is
+    reopened and continued instead of starting a new session; its records can
+    be read back with load(), which maps the file instead of parsing it.
+    """
+    def __init__(self, path=CURRENT_SESSION_FILE, flush_interval=5.0, resume_window=30 * 60):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.buffer = bytearray()
+        self.last_flush = time.monotonic()
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.resumed = os.path.exists(self.path) and self.is_valid_log() and time.time() - os.path.getmtime(self.path) <= resume_window
+        if self.resumed:
+            self.session_start = self.read_header()
+            self.truncate_partial_record()
+            self.file = open(self.path, "ab")
+        else:
+            if os.path.exists(self.path):
+                self.archive()
+            self.session_start = time.time()
+            self.file = open(self.path, "wb")
+            self.file.write(HEADER_FORMAT.pack(LOG_MAGIC, self.session_start))
+            self.file.flush()
+            os.fsync(self.file.fileno())
+
+        # Session time runs on the monotonic clock, offset by the time already spent in this session
+        self.monotonic_origin = time.monotonic() - (time.time() - self.session_start)
+        print(f"Brew log {'resumed' if self.resumed else 'started'}: {self.path}")
+
+    def is_valid_log(self):
+        """Check that the file starts with a brew log header."""
+        try:
+            with open(self.path, "rb") as f:
+                header = f.read(HEADER_FORMAT.size)
+            return len(header) == HEADER_FORMAT.size and header[:len(LOG_MAGIC)] == LOG_MAGIC
+        except OSError:
+            return False
+
+    def read_header(self):
+        with open(self.path, "rb") as f:
+            _, session_start = HEADER_FORMAT.unpack(f.read(HEADER_FORMAT.size))
+        return session_start
+
+    def truncate_partial_record(self):
+        """Drop a record that was only partly written when the app went down."""
+        size = os.path.getsize(self.path)
+        whole_size = HEADER_FORMAT.size + (size - HEADER_FORMAT.size) // RECORD_FORMAT.size * RECORD_FORMAT.size
+        if whole_size != size:
+            with open(self.path, "r+b") as f:
+                f.truncate(whole_size)
+
+    def archive(self):
+        """Rename a finished session so the current session file can be reused."""
+        stamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(os.path.getmtime(self.path)))
+        os.replace(self.path, os.path.join(os.path.dirname(self.path), f"session_{stamp}.brewlog"))
+
+    def session_time(self):
+        """Seconds since the start of the session, including time before a resume."""
+        return time.monotonic() - self.monotonic_origin
+
+    def session_time_at(self, timestamp_ns):
+        """Session time of a time.monotonic_ns() timestamp."""
+        return timestamp_ns / 1e9 - self.monotonic_origin
+
+    def append(self, elapsed, temps, regs, efficiencies, pump_speeds, state):
+        """
+        Queue one record and flush the batch if the flush interval has passed.
+
+        Parameters:
+        - elapsed (float): Session time of the sample in seconds.
+        - temps (tuple): BK, MLT and HLT temperatures (NaN for failed reads).
+        - regs (tuple): BK and HLT setpoints.
+        - efficiencies (tuple): BK and HLT heating duty cycles.
+        - pump_speeds (tuple): P1 and P2 duty cycles.
+        - state (dict): On/off flags keyed like variables.STATE.
+        """
+        state_mask = 0
+        for key, bit in STATE_BITS.items():
+            if state.get(key):
+                state_mask |= 1 << bit
+
+        self.buffer += RECORD_FORMAT.pack(elapsed, *temps, *regs, *efficiencies, *pump_speeds, state_mask)
+
+        if time.monotonic() - self.last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered records and force them to disk."""
+        self.last_flush = time.monotonic()
+        if not self.buffer:
+            return
+        try:
+            self.file.write(self.buffer)
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.buffer.clear()
+        except Exception as e:
+            print(f"Error writing brew log: {e}")
+
+    def load(self):
+        """
+        Read every record of the current session through a memory map.
+
+        Returns:
+            np.ndarray: A structured array with RECORD_DTYPE, empty if there are no records.
+        """
+        self.flush()
+        size = os.path.getsize(self.path)
+        count = (size - HEADER_FORMAT.size) // RECORD_FORMAT.size
+        if count <= 0:
+            return np.empty(0, dtype=RECORD_DTYPE)
+
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            records = np.frombuffer(mapped, dtype=RECORD_DTYPE, count=count, offset=HEADER_FORMAT.size).copy()
+        return records
+
+    def close(self):
+        """Flush pending records and close the file."""
+        self.flush()
+        self.file.close()
@@ -0,0 +1,62 @@
+# DeadlineScheduler.py
+import time
+from collections import deque
+
+
+class DeadlineScheduler:
+    """
+    Paces a loop on absolute deadlines instead of sleeping a fixed time after the work.
+
+    Slots are laid out at start + k * period, so the time spent working does not
+    add to the period and errors do not accumulate. When the work overruns one or
+    more slots, those slots are skipped and counted rather than run back to back.
+    The period is read through a callable on every slot, so it can be changed live.
+    """
+    def __init__(self, period_ms, rate_window=20):
+        """
+        Parameters:
+        - period_ms (callable): Returns the current period in milliseconds.
+        - rate_window (int): Number of recent ticks used for the achieved rate.
+        """
+        self.period_ms = period_ms
+        self.next_deadline_ns = None
+        self.missed_slots = 0
+        self.tick_times_ns = deque(maxlen=rate_window)
+
+    def wait_for_next_slot(self, should_continue=lambda: True):
+        """
+        Sleep until the start of the next slot and return the lateness of the wake-up in nanoseconds.
+
+        Parameters:
+        - should_continue (callable): Checked while sleeping; returning False ends the wait early.
+        """
+        now_ns = time.monotonic_ns()
+        period_ns = max(int(self.period_ms() * 1_000_000), 1)
+
+        if self.next_deadline_ns is None:
+            self.next_deadline_ns = now_ns
+        self.next_deadline_ns += period_ns
+
+        if now_ns > self.next_deadline_ns:
+            # Skip every slot the work ran into instead of catching up with a burst of ticks
+            missed = (now_ns - self.next_deadline_ns) // period_ns + 1
+            self.missed_slots += missed
+            self.next_deadline_ns += missed * period_ns
+
+        # Sleep in short steps so a stop request does not wait for a whole period
+        while should_continue():
+            remaining_ns = self.next_deadline_ns - time.monotonic_ns()
+            if remaining_ns <= 0:
+                break
+            time.sleep(min(remaining_ns, 100_000_000) / 1e9)
+
+        woke_ns = time.monotonic_ns()
+        self.tick_times_ns.append(woke_ns)
+        return woke_ns - self.next_deadline_ns
+
+    def achieved_rate(self):
+        """Ticks per second over the recent window, or 0.0 before there are two ticks."""
+        if len(self.tick_times_ns) < 2:
+            return 0.0
+        span_ns = self.tick_times_ns[-1] - self.tick_times_ns[0]
+        return (len(self.tick_times_ns) - 1) * 1e9 / span_ns if span_ns > 0 else 0.0
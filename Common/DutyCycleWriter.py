@@ -0,0 +1,101 @@
+# DutyCycleWriter.py
+import time, threading
+from Common.settings_store import settings_store
+
+
+class DutyCycleWriter:
+    """
+    Rate-limits duty cycle writes to the PWM outputs.
+
+    A slider swipe requests a new duty cycle on every tick. The first request to an
+    idle output is written straight away; requests that follow within the minimum
+    interval only replace the pending value, and a timer writes whatever is pending
+    once the interval has passed. Each output therefore gets at most one hardware
+    write per interval, and the last requested value is always the one that ends up
+    on the output. Requests that were replaced before being written are counted.
+    """
+    def __init__(self, min_interval_ms):
+        """
+        Parameters:
+        - min_interval_ms (callable): Returns the minimum time between two writes to one output, in milliseconds.
+        """
+        self.min_interval_ms = min_interval_ms
+        self.lock = threading.Lock()
+        self.outputs = {}  # {output: {"last_write", "pending", "write", "timer"}}
+        self.writes = {}  # {output: hardware writes}
+        self.coalesced = {}  # {output: requests replaced before being written}
+
+    def request(self, output, value, write):
+        """
+        Ask for `value` on `output`.
+
+        Parameters:
+        - output (str): Name of the output, e.g. 'BK_PWM'. Requests are coalesced per output.
+        - value: The duty cycle.
+        - write (callable): Called with the value to write it to the hardware. Called on a timer thread for delayed writes.
+        """
+        with self.lock:
+            entry = self.outputs.setdefault(output, {"last_write": None, "pending": None, "write": None, "timer": None})
+            if entry["timer"] is not None:
+                # A write is already scheduled; replace its value
+                self.coalesced[output] = self.coalesced.get(output, 0) + 1
+                entry["pending"], entry["write"] = value, write
+                return
+
+            interval = self.min_interval_ms() / 1000
+            wait = 0 if entry["last_write"] is None else entry["last_write"] + interval - time.monotonic()
+            if wait > 0:
+                entry["pending"], entry["write"] = value, write
+                entry["timer"] = threading.Timer(wait, self.write_pending, args=(output,))
+                entry["timer"].daemon = True
+                entry["timer"].start()
+                return
+            entry["last_write"] = time.monotonic()
+
+        self.apply(output, value, write)
+
+    def write_pending(self, output):
+        """Write the pending value of `output`. Runs on the timer thread."""
+        with self.lock:
+            entry = self.outputs[output]
+            if entry["timer"] is None:
+                return  # Flushed in the meantime
+            value, write = entry["pending"], entry["write"]
+            entry["pending"], entry["write"], entry["timer"] = None, None, None
+            entry["last_write"] = time.monotonic()
+        self.apply(output, value, write)
+
+    def apply(self, output, value, write):
+        with self.lock:
+            self.writes[output] = self.writes.get(output, 0) + 1
+        write(value)
+
+    def flush(self, output=None):
+        """
+        Write pending values now instead of waiting for their timers, so an output is stopped at its final value.
+
+        Parameters:
+        - output (str): Only flush this output. Defaults to all outputs.
+        """
+        with self.lock:
+            pending = [name for name, entry in self.outputs.items() if entry["timer"] is not None and output in (None, name)]
+            for output in pending:
+                self.outputs[output]["timer"].cancel()
+        for output in pending:
+            self.write_pending(output)
+
+    def statistics(self):
+        """
+        Returns:
+        dict: {output: (hardware writes, coalesced requests)}
+        """
+        with self.lock:
+            return {output: (self.writes.get(output, 0), self.coalesced.get(output, 0)) for output in self.outputs}
+
+    def report_statistics(self):
+        for output, (writes, coalesced) in self.statistics().items():
+            print(f"{output}: {writes} duty cycle writes, {coalesced} requests coalesced")
+
+
+# Create ONE global instance that can be imported; it collapses slider swipes into at most one write per output per pwm_write_interval
+duty_cycle_writer = DutyCycleWriter(lambda: settings_store.get("pwm_write_interval", 100, cast=float))
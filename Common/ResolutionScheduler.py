@@ -0,0 +1,103 @@
+# ResolutionScheduler.py
+import Common.constants as constants
+import Common.constants_rpi as constants_rpi
+from Common.utils_rpi import set_ds18b20_resolution
+
+LOW_RESOLUTION = 9    # ~94 ms conversions while ramping
+HIGH_RESOLUTION = 12  # 0.0625 °C steps while holding
+READ_OVERHEAD_MS = 50  # 1-Wire transfer and thread hand-off on top of the conversion itself
+
+
+class ResolutionScheduler:
+    """
+    Picks the DS18B20 resolution of every probe from what its vessel is doing.
+
+    A probe drops to 9-bit while its vessel is far from the setpoint or heating
+    quickly, so ramps are sampled fast, and goes up to 12-bit once the vessel is
+    within the target margin, so holds are measured precisely. Anything in between
+    uses the default resolution. A new resolution is only written after the same
+    choice was made for `confirm_samples` samples in a row, so a probe does not
+    flap between resolutions around a threshold.
+
+    The thermometer loop is paced on `read_period_ms()`, so the read rate follows
+    the resolutions: about 7 Hz while every probe is at 9-bit, and slow enough for
+    a 12-bit conversion to finish while a vessel holds.
+    """
+    def __init__(self, sensors, setpoints, far_margin=5.0, ramp_rate=1.0, confirm_samples=3):
+        """
+        Parameters:
+        - sensors (dict): {vessel: serial code}.
+        - setpoints (dict): {vessel: callable returning the current setpoint}. Vessels without a setpoint are scheduled on heating rate only.
+        - far_margin (float): Distance in °C from the setpoint beyond which a probe uses the low resolution.
+        - ramp_rate (float): Heating rate in °C per minute above which a probe uses the low resolution.
+        - confirm_samples (int): Consecutive samples that must agree before the resolution is changed.
+        """
+        self.sensors = dict(sensors)
+        self.setpoints = setpoints
+        self.far_margin = far_margin
+        self.ramp_rate = ramp_rate
+        self.confirm_samples = confirm_samples
+
+        self.resolutions = {vessel: constants_rpi.DS18B20_DEFAULT_RESOLUTION for vessel in self.sensors}
+        self.candidates = {vessel: (None, 0) for vessel in self.sensors}  # (resolution, consecutive count)
+        self.previous = {vessel: None for vessel in self.sensors}  # (time, temperature)
+        self.rates = {vessel: 0.0 for vessel in self.sensors}  # Smoothed °C per minute
+
+    def update(self, sample):
+        """
+        Feed one sample set and change probe resolutions where needed.
+
+        Parameters:
+        - sample (dict): {"time": <seconds>, "<vessel>": <temperature>, ...} as returned by ThermometerAcquisition.read_all.
+        """
+        for vessel, serial_code in self.sensors.items():
+            temperature = sample.get(vessel, -1.0)
+            if temperature < 0:
+                continue  # Failed read, keep the current resolution
+
+            self.update_rate(vessel, sample["time"], temperature)
+            desired = self.choose_resolution(vessel, temperature)
+
+            candidate, count = self.candidates[vessel]
+            count = count + 1 if candidate == desired else 1
+            self.candidates[vessel] = (desired, count)
+
+            if desired != self.resolutions[vessel] and count >= self.confirm_samples:
+                if set_ds18b20_resolution(serial_code, str(desired)):
+                    print(f"{vessel} probe switched from {self.resolutions[vessel]}-bit to {desired}-bit.")
+                    self.resolutions[vessel] = desired
+
+    def update_rate(self, vessel, sample_time, temperature):
+        """Track a smoothed heating rate in °C per minute."""
+        previous = self.previous[vessel]
+        self.previous[vessel] = (sample_time, temperature)
+        if previous is None or sample_time <= previous[0]:
+            return
+
+        rate = (temperature - previous[1]) / (sample_time - previous[0]) * 60
+        self.rates[vessel] = 0.8 * self.rates[vessel] + 0.2 * rate
+
+    def choose_resolution(self, vessel, temperature):
+        """Return the resolution in bits that suits the vessel right now."""
+        setpoint_getter = self.setpoints.get(vessel)
+        setpoint = setpoint_getter() if setpoint_getter else None
+
+        if setpoint is not None:
+            distance = abs(temperature - setpoint)
+            if distance <= constants.TEMP_REACHED_MARGIN:
+                return HIGH_RESOLUTION
+            if distance > self.far_margin:
+                return LOW_RESOLUTION
+
+        if self.rates[vessel] >= self.ramp_rate:
+            return LOW_RESOLUTION
+
+        return constants_rpi.DS18B20_DEFAULT_RESOLUTION
+
+    def conversion_time_ms(self):
+        """Longest conversion time of the current resolutions, i.e. the cost of one concurrent tick."""
+        return max(constants_rpi.DS18B20_CONVERSION_TIME_MS[bits] for bits in self.resolutions.values())
+
+    def read_period_ms(self):
+        """Shortest read period in milliseconds that the slowest probe can keep up with at its current resolution."""
+        return self.conversion_time_ms() + READ_OVERHEAD_MS
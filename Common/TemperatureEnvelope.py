@@ -0,0 +1,150 @@
+# TemperatureEnvelope.py
+import numpy as np
+
+
+class EnvelopeLevel:
+    """One level of the envelope: min/max of every column over fixed-size blocks of samples."""
+    def __init__(self, block_size, columns, capacity=1024):
+        self.block_size = block_size  # Raw samples per block
+        self.size = 0
+        self.capacity = capacity
+        names = ["time_start", "time_end"] + [f"{c}_{e}" for c in columns for e in ("min", "max")]
+        self.columns = {name: np.empty(capacity, dtype=np.float64) for name in names}
+
+    def extend(self, values):
+        """Append several blocks at once. values maps column name to a 1-D array."""
+        count = len(values["time_start"])
+        if self.size + count > self.capacity:
+            new_capacity = self.capacity
+            while new_capacity < self.size + count:
+                new_capacity *= 2
+            for name, column in self.columns.items():
+                new_column = np.empty(new_capacity, dtype=column.dtype)
+                new_column[:self.size] = column[:self.size]
+                self.columns[name] = new_column
+            self.capacity = new_capacity
+
+        for name, column in self.columns.items():
+            column[self.size:self.size + count] = values[name]
+        self.size += count
+
+    def column(self, name):
+        return self.columns[name][:self.size]
+
+
+class MinMaxEnvelope:
+    """
+    Incrementally maintained min/max pyramid over a TemperatureHistory.
+
+    Level 1 holds the min and max of every `factor` raw samples, level 2 of every
+    `factor` level-1 blocks, and so on. New samples are folded in as they arrive,
+    so rendering any x-range only has to pick the coarsest level that still gives
+    about one block per pixel and slice it. Because each block keeps both its
+    minimum and maximum, short spikes survive the reduction.
+    """
+    def __init__(self, history, columns=("bk", "mlt", "hlt"), factor=4):
+        self.history = history
+        self.data_columns = tuple(columns)
+        self.factor = factor
+        self.levels = []  # levels[0] is level 1 (block size == factor)
+        self.folded = []  # Number of source entries folded into each level
+
+    def reset(self):
+        """Drop all levels, e.g. after the history was cleared or reloaded."""
+        self.levels = []
+        self.folded = []
+
+    def update(self):
+        """Fold any samples appended to the history since the last call into the levels."""
+        if self.folded and len(self.history) < self.folded[0]:
+            self.reset()  # The history shrank, so the levels no longer describe it
+
+        level_index = 0
+        source_size = len(self.history)
+        while source_size >= self.factor:
+            if level_index == len(self.levels):
+                self.levels.append(EnvelopeLevel(self.factor ** (level_index + 1), self.data_columns))
+                self.folded.append(0)
+
+            start = self.folded[level_index]
+            block_count = (source_size - start) // self.factor
+            if block_count > 0:
+                stop = start + block_count * self.factor
+                self.levels[level_index].extend(self._reduce(level_index, start, stop, block_count))
+                self.folded[level_index] = stop
+
+            source_size = self.levels[level_index].size
+            level_index += 1
+
+    def _reduce(self, level_index, start, stop, block_count):
+        """Reduce source entries [start, stop) of the level below into block_count blocks."""
+        shape = (block_count, self.factor)
+        values = {}
+        if level_index == 0:
+            times = self.history.column("time")[start:stop].reshape(shape)
+            values["time_start"] = times[:, 0]
+            values["time_end"] = times[:, -1]
+            for name in self.data_columns:
+                samples = self.history.column(name)[start:stop].reshape(shape)
+                values[f"{name}_min"] = np.fmin.reduce(samples, axis=1)
+                values[f"{name}_max"] = np.fmax.reduce(samples, axis=1)
+        else:
+            source = self.levels[level_index - 1]
+            values["time_start"] = source.column("time_start")[start:stop].reshape(shape)[:, 0]
+            values["time_end"] = source.column("time_end")[start:stop].reshape(shape)[:, -1]
+            for name in self.data_columns:
+                values[f"{name}_min"] = np.fmin.reduce(source.column(f"{name}_min")[start:stop].reshape(shape), axis=1)
+                values[f"{name}_max"] = np.fmax.reduce(source.column(f"{name}_max")[start:stop].reshape(shape), axis=1)
+        return values
+
+    def render(self, x_min, x_max, pixel_width):
+        """
+        Return plot data for the samples between x_min and x_max, reduced to about pixel_width buckets.
+
+        Returns:
+            tuple: (times, {column: values}). When the visible range already fits the
+                   pixel width, the arrays are zero-copy views of the raw history.
+        """
+        times = self.history.column("time")
+        first = max(0, int(np.searchsorted(times, x_min, side="left")) - 1)
+        last = min(len(times), int(np.searchsorted(times, x_max, side="right")) + 1)
+        visible = last - first
+        pixel_width = max(1, int(pixel_width))
+
+        if visible <= 2 * pixel_width or not self.levels:
+            return times[first:last], {name: self.history.column(name)[first:last] for name in self.data_columns}
+
+        # Coarsest level that still leaves at least one bucket per pixel
+        level_index = 0
+        while (level_index + 1 < len(self.levels)
+               and visible // self.levels[level_index + 1].block_size >= pixel_width):
+            level_index += 1
+        level = self.levels[level_index]
+        block_size = level.block_size
+
+        block_first = first // block_size
+        block_last = min(level.size, -(-last // block_size))
+        tail_start = max(first, level.size * block_size)  # Raw samples not yet folded into this level
+        has_tail = tail_start < last
+        bucket_count = max(0, block_last - block_first) + (1 if has_tail else 0)
+
+        # Every bucket becomes two points, its minimum at the start and its maximum at the end
+        out_times = np.empty(2 * bucket_count, dtype=np.float64)
+        out_times[0:2 * (bucket_count - has_tail):2] = level.column("time_start")[block_first:block_last]
+        out_times[1:2 * (bucket_count - has_tail):2] = level.column("time_end")[block_first:block_last]
+        if has_tail:
+            out_times[-2] = times[tail_start]
+            out_times[-1] = times[last - 1]
+
+        out_values = {}
+        for name in self.data_columns:
+            values = np.empty(2 * bucket_count, dtype=np.float64)
+            values[0:2 * (bucket_count - has_tail):2] = level.column(f"{name}_min")[block_first:block_last]
+            values[1:2 * (bucket_count - has_tail):2] = level.column(f"{name}_max")[block_first:block_last]
+            if has_tail:
+                tail = self.history.column(name)[tail_start:last]
+                values[-2] = np.fmin.reduce(tail)
+                values[-1] = np.fmax.reduce(tail)
+            out_values[name] = values
+
+        return out_times, out_values
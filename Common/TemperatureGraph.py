@@ -1,23 +1,28 @@
 # TemperatureGraph.py
-from pyqtgraph import PlotWidget, mkPen, AxisItem, LegendItem
-from PyQt5.QtCore import QTimer
+from pyqtgraph import PlotWidget, mkPen, AxisItem, LegendItem, ViewBox
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtWidgets import QWidget, QLabel
 from PyQt5.QtGui import QFont
-from datetime import datetime
+import time
 import numpy as np
 from Common.constants import GRAPH_LINE_WIDTH
+from Common.TemperatureHistory import TemperatureHistory
+from Common.TemperatureEnvelope import MinMaxEnvelope
 
 
 class TemperatureGraph(QWidget):
-    def __init__(self, parent=None, width=1420, height=950, x_pos=400, y_pos=0):
+    def __init__(self, parent=None, width=1420, height=950, x_pos=400, y_pos=0, temperature_history=None):
         super().__init__(parent)
         self.width = width  # Graph width
         self.height = height  # Graph height
         self.x_pos = x_pos  # Graph x position
         self.y_pos = y_pos  # Graph y position
-        self.init_ui()
-        self.temperature_history = []  # Initialize an empty history list
+        # Preallocated sample store; pass the app's history to draw samples recorded before the graph existed
+        self.temperature_history = temperature_history if temperature_history is not None else TemperatureHistory()
+        self.envelope = MinMaxEnvelope(self.temperature_history)  # Min/max levels used for drawing
         self.start_time = None  # Store the time of the first reading
+        self.render_pending = len(self.temperature_history) > 0  # Samples to draw once the graph is shown
+        self.init_ui()
 
     def init_ui(self):
         # Create custom axes for white color and larger text
@@ -69,39 +74,73 @@ class TemperatureGraph(QWidget):
         self.mlt_line.sigClicked.connect(lambda item, points: self.show_point_info(item, points, "MLT"))
         self.hlt_line.sigClicked.connect(lambda item, points: self.show_point_info(item, points, "HLT"))
 
-    def update_graph(self, temp_bk, temp_mlt, temp_hlt):
-        """Update the graph with new temperature data."""
-        # Capture the current timestamp
-        current_time = datetime.now()
-
-        # Initialize the start time if this is the first reading
-        if self.start_time is None:
-            self.start_time = current_time
+        # Redraw from the envelope whenever the visible x-range changes (zoom, pan, auto-range)
+        self.plot_widget.getViewBox().sigXRangeChanged.connect(lambda *_: self.render_lines())
 
-        # Calculate elapsed time in seconds since the start
-        elapsed_time = (current_time - self.start_time).total_seconds()
+    def update_graph(self, temp_bk, temp_mlt, temp_hlt, elapsed_time=None):
+        """
+        Update the graph with new temperature data.
 
-        # Prepare temperature data, replacing negative values with NaN
-        entry = {
-            "time": elapsed_time,  # Store elapsed time as x-axis value
-            "bk": temp_bk if temp_bk >= 0 else np.nan,  # Replace negative values with NaN
-            "mlt": temp_mlt if temp_mlt >= 0 else np.nan,
-            "hlt": temp_hlt if temp_hlt >= 0 else np.nan,
-        }
+        Parameters:
+        - elapsed_time (float): Session time of the sample in seconds. Measured from the first reading if omitted.
+        """
+        self.append_sample(temp_bk, temp_mlt, temp_hlt, elapsed_time)
+        self.refresh()
+
+    def append_sample(self, temp_bk, temp_mlt, temp_hlt, elapsed_time=None):
+        """Record a sample without drawing it; call refresh() once after appending a batch."""
+        if elapsed_time is None:
+            # Capture the current monotonic timestamp
+            current_time = time.monotonic()
+
+            # Initialize the start time if this is the first reading
+            if self.start_time is None:
+                self.start_time = current_time
+
+            # Calculate elapsed time in seconds since the start
+            elapsed_time = current_time - self.start_time
+
+        # Append the sample in place, with elapsed time as x-axis value and failed reads as NaN
+        self.temperature_history.append_reading(elapsed_time, temp_bk, temp_mlt, temp_hlt)
+
+    def refresh(self):
+        """Draw the samples appended since the last render."""
+        # Keep recording while hidden, but leave the drawing to showEvent
+        if not self.isVisible():
+            self.render_pending = True
+            return
+
+        self.envelope.update()
+        self.render_lines()
+
+    def showEvent(self, event):
+        """Catch up on samples recorded while the graph was hidden with a single render."""
+        super().showEvent(event)
+        if self.render_pending:
+            self.render_pending = False
+            self.envelope.update()
+            self.render_lines()
+
+    def render_lines(self):
+        """
+        Draw the part of the history that is in view, reduced to roughly one min/max pair per pixel column.
+        """
+        if len(self.temperature_history) == 0:
+            return
 
-        # Append the entry to history
-        self.temperature_history.append(entry)
+        view_box = self.plot_widget.getViewBox()
+        times = self.temperature_history.column("time")
+        if view_box.autoRangeEnabled()[0]:
+            x_min, x_max = times[0], times[-1]  # Auto-range needs the full extent of the data
+        else:
+            x_min, x_max = view_box.viewRange()[0]
 
-        # Extract data for plotting
-        times = [entry["time"] for entry in self.temperature_history]
-        bk_temps = [entry["bk"] for entry in self.temperature_history]
-        mlt_temps = [entry["mlt"] for entry in self.temperature_history]
-        hlt_temps = [entry["hlt"] for entry in self.temperature_history]
+        pixel_width = view_box.width() or self.width
+        line_times, line_values = self.envelope.render(x_min, x_max, pixel_width)
 
-        # Update the plot lines
-        self.bk_line.setData(times, bk_temps)
-        self.mlt_line.setData(times, mlt_temps)
-        self.hlt_line.setData(times, hlt_temps)
+        self.bk_line.setData(line_times, line_values["bk"])
+        self.mlt_line.setData(line_times, line_values["mlt"])
+        self.hlt_line.setData(line_times, line_values["hlt"])
 
     def zoom_in(self, axis="y"):
         """
@@ -0,0 +1,82 @@
+# TemperatureHistory.py
+import numpy as np
+
+# Columns stored for every sample: elapsed time plus one temperature per vessel
+HISTORY_DTYPE = np.dtype([
+    ("time", np.float64),
+    ("bk", np.float64),
+    ("mlt", np.float64),
+    ("hlt", np.float64),
+])
+
+
+class TemperatureHistory:
+    """
+    Preallocated, growable column store for the temperature history.
+
+    Every column lives in its own contiguous NumPy array, so appending a sample
+    is an in-place write and the plot lines can be handed views of the filled
+    part without copying. When the capacity is used up all columns are doubled,
+    which keeps appends amortised O(1) for a session of any length.
+    """
+    def __init__(self, capacity=8 * 60 * 60 * 2):
+        self.capacity = max(1, int(capacity))  # Default holds 8 hours at 2 Hz
+        self.size = 0
+        self.columns = {name: np.empty(self.capacity, dtype=HISTORY_DTYPE[name]) for name in HISTORY_DTYPE.names}
+
+    def __len__(self):
+        return self.size
+
+    def grow(self, min_capacity):
+        """Reallocate all columns to at least min_capacity, keeping the stored samples."""
+        new_capacity = self.capacity
+        while new_capacity < min_capacity:
+            new_capacity *= 2
+
+        for name, column in self.columns.items():
+            new_column = np.empty(new_capacity, dtype=column.dtype)
+            new_column[:self.size] = column[:self.size]
+            self.columns[name] = new_column
+        self.capacity = new_capacity
+
+    def append(self, time, bk, mlt, hlt):
+        """Append one sample in place."""
+        if self.size == self.capacity:
+            self.grow(self.size + 1)
+
+        index = self.size
+        self.columns["time"][index] = time
+        self.columns["bk"][index] = bk
+        self.columns["mlt"][index] = mlt
+        self.columns["hlt"][index] = hlt
+        self.size += 1
+
+    def append_reading(self, time, bk, mlt, hlt):
+        """Append one sample of sensor readings, storing failed (negative) reads as NaN."""
+        self.append(
+            time,
+            bk if bk >= 0 else np.nan,
+            mlt if mlt >= 0 else np.nan,
+            hlt if hlt >= 0 else np.nan,
+        )
+
+    def extend(self, time, bk, mlt, hlt):
+        """Append many samples at once from equally long arrays."""
+        count = len(time)
+        if self.size + count > self.capacity:
+            self.grow(self.size + count)
+
+        end = self.size + count
+        self.columns["time"][self.size:end] = time
+        self.columns["bk"][self.size:end] = bk
+        self.columns["mlt"][self.size:end] = mlt
+        self.columns["hlt"][self.size:end] = hlt
+        self.size = end
+
+    def column(self, name):
+        """Return a zero-copy view of the filled part of a column."""
+        return self.columns[name][:self.size]
+
+    def clear(self):
+        """Forget all samples but keep the allocated storage."""
+        self.size = 0
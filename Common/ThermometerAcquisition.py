@@ -0,0 +1,119 @@
+# ThermometerAcquisition.py
+import os, time, math
+from concurrent.futures import ThreadPoolExecutor
+from Common.config import IS_RPI
+import Common.constants as constants
+import Common.constants_rpi as constants_rpi
+from Common.utils_rpi import read_ds18b20
+
+# A reading is a deadline miss when its interval exceeds the read period by more than this fraction
+DEADLINE_TOLERANCE = 0.25
+
+
+def read_ds18b20_stamped(serial_code):
+    """Read a sensor and stamp the value with the monotonic time its conversion completed."""
+    temperature = read_ds18b20(serial_code)
+    return temperature, time.monotonic_ns()
+
+
+class SensorTimingStatistics:
+    """Running interval, jitter and deadline-miss statistics of one sensor's readings."""
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.last_timestamp_ns = None
+        self.intervals = 0
+        self.mean_ms = 0.0
+        self.m2 = 0.0  # Sum of squared deviations from the mean (Welford)
+        self.max_deviation_ms = 0.0
+        self.deadline_misses = 0
+
+    def add(self, timestamp_ns, period_ms):
+        """Record a reading's timestamp against the configured read period."""
+        if self.last_timestamp_ns is not None:
+            interval_ms = (timestamp_ns - self.last_timestamp_ns) / 1e6
+            self.intervals += 1
+            delta = interval_ms - self.mean_ms
+            self.mean_ms += delta / self.intervals
+            self.m2 += delta * (interval_ms - self.mean_ms)
+            self.max_deviation_ms = max(self.max_deviation_ms, abs(interval_ms - period_ms))
+            if interval_ms > period_ms * (1 + DEADLINE_TOLERANCE):
+                self.deadline_misses += 1
+        self.last_timestamp_ns = timestamp_ns
+
+    def summary(self):
+        """Return the statistics as a dict of plain numbers."""
+        return {
+            "intervals": self.intervals,
+            "mean_interval_ms": self.mean_ms,
+            "jitter_ms": math.sqrt(self.m2 / self.intervals) if self.intervals > 1 else 0.0,
+            "max_deviation_ms": self.max_deviation_ms,
+            "deadline_misses": self.deadline_misses,
+        }
+
+
+class ThermometerAcquisition:
+    """
+    Reads every configured DS18B20 sensor at the same time.
+
+    Each sensor gets its own worker in a small thread pool, so the blocking
+    conversion of one probe overlaps with the others and a tick costs one
+    conversion time instead of the sum of all of them. When the 1-Wire bus
+    master supports it, a bulk conversion is triggered first so all probes
+    convert in parallel on the bus as well.
+    """
+    def __init__(self, sensors=None):
+        self.sensors = dict(sensors or constants_rpi.DS18B20_SENSORS)  # {vessel: serial code}
+        self.executor = ThreadPoolExecutor(max_workers=len(self.sensors), thread_name_prefix="ds18b20")
+        self.bulk_read_path = constants_rpi.W1_THERM_BULK_READ if IS_RPI and os.path.exists(constants_rpi.W1_THERM_BULK_READ) else None
+        self.timing = {vessel: SensorTimingStatistics() for vessel in self.sensors}
+
+    def trigger_bulk_conversion(self):
+        """Start a simultaneous conversion on every sensor on the bus, if supported."""
+        if self.bulk_read_path is None:
+            return
+        try:
+            with open(self.bulk_read_path, "w") as f:
+                f.write("trigger\n")
+        except Exception as e:
+            print(f"Warning: Bulk conversion trigger failed, falling back to per-sensor conversion: {e}")
+            self.bulk_read_path = None
+
+    def read_all(self, period_ms=None):
+        """
+        Read all sensors concurrently.
+
+        Parameters:
+        - period_ms (float): Read period the timing statistics are measured against. Defaults to the configured period.
+
+        Returns:
+            dict: One sample set, {"time": <monotonic seconds>, "timestamps": {<vessel>: <monotonic ns>},
+                  "<vessel>": <temperature>, ...}. Every reading is stamped when its conversion
+                  completed and "time" is the latest of those stamps. Failed reads are reported
+                  as -1.0, like read_ds18b20.
+        """
+        self.trigger_bulk_conversion()
+        futures = {vessel: self.executor.submit(read_ds18b20_stamped, code) for vessel, code in self.sensors.items()}
+
+        sample = {"timestamps": {}}
+        for vessel, future in futures.items():
+            temperature, timestamp_ns = future.result()
+            sample[vessel] = temperature
+            sample["timestamps"][vessel] = timestamp_ns
+            self.timing[vessel].add(timestamp_ns, period_ms or constants.THERMOMETER_READ_FREQUENCY)
+
+        sample["time"] = max(sample["timestamps"].values()) / 1e9
+        return sample
+
+    def timing_statistics(self):
+        """Return {vessel: timing summary} for every sensor since the last reset."""
+        return {vessel: statistics.summary() for vessel, statistics in self.timing.items()}
+
+    def reset_timing_statistics(self):
+        for statistics in self.timing.values():
+            statistics.reset()
+
+    def close(self):
+        """Shut down the worker pool."""
+        self.executor.shutdown(wait=False)
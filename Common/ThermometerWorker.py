@@ -1,123 +1,184 @@
-from PyQt5.QtCore import QObject, QThread, pyqtSignal
+import time, threading
+from collections import namedtuple
+from PyQt5.QtCore import QObject, pyqtSignal
 import Common.constants as constants
-from Common.utils import adjust_image_height, play_audio
-from Common.constants_gui import POT_ON_FOREGROUND_HEIGHT
+from Common.utils import play_audio
+from Common.sound_service import PRIORITY_ALERT
 import Common.variables as variables
-import Common.constants_rpi as constants_rpi
-from Common.utils_rpi import read_ds18b20
-from Common.TemperatureGraph import TemperatureGraph
+from Common.ThermometerAcquisition import ThermometerAcquisition
+from Common.ResolutionScheduler import ResolutionScheduler
+from Common.DeadlineScheduler import DeadlineScheduler
+from Common.get_setting import get_setting
+from Common.settings_store import settings_store
+from Common.config import IS_RPI
+
+# Settings the loop picks up while running, without a restart
+LIVE_SETTINGS = ("thermometor_read_frequency", "target_temp_margin", "adaptive_resolution", "resolution_far_margin", "resolution_ramp_rate")
+
+# Everything the GUI needs from one tick, captured in the worker thread so the GUI never reads half-updated globals
+ThermometerSnapshot = namedtuple("ThermometerSnapshot", [
+    "temp_bk", "temp_mlt", "temp_hlt",                 # -1.0 for failed reads
+    "timestamp_bk", "timestamp_mlt", "timestamp_hlt",  # monotonic_ns acquisition times
+    "temp_reg_bk", "temp_reg_hlt",
+    "bk_on", "hlt_on",
+    "elapsed_time",                                    # Session time of the sample set in seconds
+])
 
 
 class ThermometerWorker(QObject):
-    temperature_updated_bk = pyqtSignal(float)  # Signal to send the temperature reading
-    temperature_updated_hlt = pyqtSignal(float)
-    temperature_updated_mlt = pyqtSignal(float)
+    snapshot_ready = pyqtSignal(object)  # Signal to send one ThermometerSnapshot per tick
     finished = pyqtSignal()  # Signal to indicate the thread is finished
 
-    def __init__(self, static_elements, graph):
+    def __init__(self, brew_log=None):
         super().__init__()
         self._running = True  # Control the thread execution
-        self.static_elements = static_elements  # Store static elements for access
-        self.graph = graph  # Pass the graph instance to update
+        self.acquisition = ThermometerAcquisition()  # Reads all sensors concurrently
+        self.brew_log = brew_log  # Optional on-disk session log
+        self.resolution_scheduler = self.create_resolution_scheduler()  # None when adaptive resolution is off
+        self.session_origin_ns = time.monotonic_ns()  # Session time zero when there is no brew log
+        self.last_timing_report = time.monotonic()
+        self.scheduler = DeadlineScheduler(self.read_period_ms)  # Paces the loop on absolute deadlines
+        self.settings_changed = threading.Event()  # Set by the settings watcher, handled at the start of the next tick
+        settings_store.subscribe(self.on_settings_changed, keys=LIVE_SETTINGS)
 
     def run(self):
         """Worker's main loop to read temperatures."""
         while self._running:
-            # Read and update temperature values
-            variables.temp_BK = self.read_thermometer_bk()
-            variables.temp_MLT = self.read_thermometer_mlt()
-            variables.temp_HLT = self.read_thermometer_hlt()
+            if self.settings_changed.is_set():
+                self.apply_settings()
+
+            # Read all sensors at once and update temperature values
+            sample = self.acquisition.read_all(self.read_period_ms())
+            variables.state.update(temp_BK=sample['BK'], temp_MLT=sample['MLT'], temp_HLT=sample['HLT'])
+
+            if self.resolution_scheduler:
+                self.resolution_scheduler.update(sample)
 
             self.check_if_reg_temp_reached_BK()
             self.check_if_reg_temp_reached_HLT()
 
-            if variables.temp_BK >= 0:
-                self.temperature_updated_bk.emit(variables.temp_BK)
-            if variables.temp_MLT >= 0:
-                self.temperature_updated_mlt.emit(variables.temp_MLT)
-            if variables.temp_HLT >= 0:
-                self.temperature_updated_hlt.emit(variables.temp_HLT)
-
-            # Calculate temperature progress for BK and HLT
-            temp_progress_bk = min(100, max(0, (variables.temp_BK / variables.temp_REG_BK) * 100)) if variables.temp_REG_BK > 0 else 0
-            temp_progress_hlt = min(100, max(0, (variables.temp_HLT / variables.temp_REG_HLT) * 100)) if variables.temp_REG_HLT > 0 else 0
-
-            # Adjust image height dynamically
-            if 'IMG_Pot_BK_On_Foreground' in self.static_elements:  
-                adjust_image_height(self.static_elements['IMG_Pot_BK_On_Foreground'], temp_progress_bk, POT_ON_FOREGROUND_HEIGHT)
-            if 'IMG_Pot_HLT_On_Foreground' in self.static_elements:  
-                adjust_image_height(self.static_elements['IMG_Pot_HLT_On_Foreground'], temp_progress_hlt, POT_ON_FOREGROUND_HEIGHT)
-
-            # Update temperature-reached visuals
-            self.update_pot_foregrounds_if_temp_reached()
-
-            # Update the graph
-            self.graph.update_graph(variables.temp_BK, variables.temp_MLT, variables.temp_HLT)
-
-            # Wait for the next reading
-            QThread.msleep(constants.THERMOMETER_READ_FREQUENCY)
-
-    def read_thermometer_bk(self):
-        return read_ds18b20(constants_rpi.DS18B20_BK)  
-    
-    def read_thermometer_mlt(self):
-        return read_ds18b20(constants_rpi.DS18B20_MLT)  
-
-    def read_thermometer_hlt(self):
-        return read_ds18b20(constants_rpi.DS18B20_HLT)  
-    
+            # Read the rest of the tick from one consistent snapshot, whatever the GUI and assistant write meanwhile
+            _, state = variables.state.snapshot()
+
+            # Hand the GUI one immutable snapshot; it applies every widget change in the GUI thread
+            timestamps = sample['timestamps']
+            elapsed_time = self.session_time(max(timestamps.values()))
+            self.snapshot_ready.emit(ThermometerSnapshot(
+                state['temp_BK'], state['temp_MLT'], state['temp_HLT'],
+                timestamps['BK'], timestamps['MLT'], timestamps['HLT'],
+                state['temp_REG_BK'], state['temp_REG_HLT'],
+                state['BK_ON'], state['HLT_ON'],
+                elapsed_time,
+            ))
+
+            if self.brew_log:
+                self.log_sample(elapsed_time, state)
+
+            self.report_timing_statistics()
+
+            # Wait for the next slot, skipping any the work overran
+            self.scheduler.wait_for_next_slot(lambda: self._running)
+
+        settings_store.unsubscribe(self.on_settings_changed)
+        self.acquisition.close()
+
+    def on_settings_changed(self, changed):
+        """Called on the settings watcher thread; the loop applies the change between ticks."""
+        self.settings_changed.set()
+
+    def apply_settings(self):
+        """Pick up changed settings. The read period and margin are read from constants every tick already."""
+        self.settings_changed.clear()
+        previous = self.resolution_scheduler
+        self.resolution_scheduler = self.create_resolution_scheduler()
+        if previous and self.resolution_scheduler:
+            self.resolution_scheduler.resolutions.update(previous.resolutions)  # The probes keep their resolution, and the period must match it
+        self.acquisition.reset_timing_statistics()  # Timing was measured against the old period
+        print(f"Thermometer loop: applied new settings, period {self.read_period_ms()} ms")
+
+    def read_period_ms(self):
+        """
+        Period of the loop in milliseconds.
+
+        With adaptive resolution the period follows the probes' conversion time, so ramps
+        are read fast at 9-bit and a 12-bit hold does not overrun every slot. Otherwise it
+        is the configured read frequency.
+        """
+        if self.resolution_scheduler:
+            return self.resolution_scheduler.read_period_ms()
+        return constants.THERMOMETER_READ_FREQUENCY
+
+    def session_time(self, timestamp_ns):
+        """Convert a monotonic_ns timestamp to seconds on the session's x-axis."""
+        if self.brew_log:
+            return self.brew_log.session_time_at(timestamp_ns)
+        return (timestamp_ns - self.session_origin_ns) / 1e9
+
+    def timing_statistics(self):
+        """Per-sensor interval, jitter and deadline-miss statistics of the readings."""
+        return self.acquisition.timing_statistics()
+
+    def achieved_rate(self):
+        """Ticks per second the loop actually achieved recently."""
+        return self.scheduler.achieved_rate()
+
+    def report_timing_statistics(self, interval=60):
+        """Print the timing statistics every `interval` seconds, so the achieved read rate can be checked."""
+        if time.monotonic() - self.last_timing_report < interval:
+            return
+        self.last_timing_report = time.monotonic()
+        print(
+            f"Thermometer loop: {self.scheduler.achieved_rate():.2f} Hz achieved "
+            f"(target {1000 / self.read_period_ms():.2f} Hz), {self.scheduler.missed_slots} missed slots"
+        )
+        for vessel, stats in self.timing_statistics().items():
+            print(
+                f"{vessel} readings: mean interval {stats['mean_interval_ms']:.1f} ms "
+                f"(target {self.read_period_ms()} ms), jitter {stats['jitter_ms']:.1f} ms, "
+                f"max deviation {stats['max_deviation_ms']:.1f} ms, {stats['deadline_misses']} deadline misses"
+            )
+
+    def create_resolution_scheduler(self):
+        """Create the adaptive DS18B20 resolution scheduler if it is enabled and real probes are attached."""
+        if not IS_RPI or not get_setting("adaptive_resolution"):
+            return None
+        return ResolutionScheduler(
+            self.acquisition.sensors,
+            setpoints={
+                'BK': lambda: variables.temp_REG_BK,
+                'HLT': lambda: variables.temp_REG_HLT,
+            },
+            far_margin=get_setting("resolution_far_margin"),
+            ramp_rate=get_setting("resolution_ramp_rate"),
+        )
+
+    def log_sample(self, elapsed_time, state):
+        """Append the temperatures, setpoints, duty cycles and on/off state of a state snapshot to the brew log."""
+        temps = tuple(temp if temp >= 0 else float("nan") for temp in (state['temp_BK'], state['temp_MLT'], state['temp_HLT']))
+        self.brew_log.append(
+            elapsed_time,
+            temps,
+            (state['temp_REG_BK'], state['temp_REG_HLT']),
+            (state['efficiency_BK'], state['efficiency_HLT']),
+            (state['pump_speed_P1'], state['pump_speed_P2']),
+            state,
+        )
+
     def stop(self):
         """Stop the worker loop."""
         self._running = False
 
-    def update_temp_reached_element(self, temp, temp_reg, state, element, threshold):
-        """Update visibility of temperature-reached elements."""
-        if state:
-            if temp >= 100 and temp_reg == 100:
-                element.show()
-            elif abs(temp - temp_reg) <= threshold:
-                element.show()
-            else:
-                element.hide()
-        else:
-            element.hide()
-
-    def update_pot_foregrounds_if_temp_reached(self):
-        """Update the pot foregrounds if the temperature is reached."""
-        if 'IMG_Pot_BK_On_Temp_Reached' in self.static_elements:
-            self.update_temp_reached_element(
-                variables.temp_BK,
-                variables.temp_REG_BK,
-                variables.STATE['BK_ON'],
-                self.static_elements['IMG_Pot_BK_On_Temp_Reached'],
-                constants.TEMP_REACHED_MARGIN
-            )
-
-        if 'IMG_Pot_HLT_On_Temp_Reached' in self.static_elements:
-            self.update_temp_reached_element(
-                variables.temp_HLT,
-                variables.temp_REG_HLT,
-                variables.STATE['HLT_ON'],
-                self.static_elements['IMG_Pot_HLT_On_Temp_Reached'],
-                constants.TEMP_REACHED_MARGIN
-            )
-
     def check_if_reg_temp_reached_BK(self):
-        if variables.temp_REG_BK-constants.TEMP_REACHED_MARGIN <= variables.temp_BK <= variables.temp_REG_BK+constants.TEMP_REACHED_MARGIN:
-            if variables.set_temp_reached_BK == False:
-                variables.set_temp_reached_BK = True
-                play_audio("BK_set_temp_reached - Male.mp3")
-        else:
-             if variables.set_temp_reached_BK == True:
-                 variables.set_temp_reached_BK = False
-    
+        self.check_if_reg_temp_reached('BK', "BK_set_temp_reached - Male.mp3")
+
     def check_if_reg_temp_reached_HLT(self):
-        if variables.temp_REG_HLT-constants.TEMP_REACHED_MARGIN <= variables.temp_HLT <= variables.temp_REG_HLT+constants.TEMP_REACHED_MARGIN:
-            if variables.set_temp_reached_HLT == False:
-                variables.set_temp_reached_HLT = True
-                play_audio("HLT_set_temp_reached - Male.mp3")
-        else:
-             if variables.set_temp_reached_HLT == True:
-                 variables.set_temp_reached_HLT = False
-    
-    
\ No newline at end of file
+        self.check_if_reg_temp_reached('HLT', "HLT_set_temp_reached - Male.mp3")
+
+    def check_if_reg_temp_reached(self, pot, sound):
+        _, state = variables.state.snapshot()
+        temp, temp_reg = state[f'temp_{pot}'], state[f'temp_REG_{pot}']
+        reached = temp_reg-constants.TEMP_REACHED_MARGIN <= temp <= temp_reg+constants.TEMP_REACHED_MARGIN
+        if reached != state[f'set_temp_reached_{pot}']:
+            variables.state.update({f'set_temp_reached_{pot}': reached})
+            if reached:
+                play_audio(sound, priority=PRIORITY_ALERT)
@@ -0,0 +1,144 @@
+# asset_cache.py
+import os
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtGui import QPixmap, QImage, QFontDatabase
+from PyQt5.QtCore import Qt
+
+ASSETS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "Assets"))
+FONT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "CascadiaCode.ttf")
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")  # Decoded to QImage while preloading
+RAW_EXTENSIONS = (".gif", ".ttf")  # Read into memory while preloading; QMovie and the font database take the bytes
+
+# Process-wide caches, keyed by normalized absolute path so every screen shares one entry per file
+_pixmaps = {}  # {(path, size): QPixmap}; size is None for the image as decoded
+_font_families = {}  # {path: registered family name, or None if the font could not be loaded}
+_files = {}  # {path: bytes} of GIFs and other files read whole
+_preloaded = {}  # {path: Future} started by preload_assets, taken over by the getters on first use
+_stats = {"hits": 0, "misses": 0}
+
+
+def _normalize(path):
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _load(path):
+    """Decode an image or read a file. Runs on the preload threads, so it must not create pixmaps."""
+    if path.lower().endswith(IMAGE_EXTENSIONS):
+        return QImage(path)
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def preload_assets(max_workers=4):
+    """
+    Start decoding every image in the Assets folder, and reading the GIFs and the font, on a thread pool.
+
+    Call it before QApplication is created so decoding overlaps with the remaining imports and
+    setup. QImage can be built off the GUI thread; the getters below turn the results into
+    pixmaps on the GUI thread when a widget first asks for them, which is only a cheap conversion.
+    """
+    paths = [FONT_PATH]
+    for root, _, files in os.walk(ASSETS_DIR):
+        paths += [os.path.join(root, name) for name in files if name.lower().endswith(IMAGE_EXTENSIONS + RAW_EXTENSIONS)]
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="asset-preload")
+    for path in paths:
+        _preloaded[_normalize(path)] = executor.submit(_load, path)
+    executor.shutdown(wait=False)  # The workers finish the queued files and exit
+
+
+def _take_preloaded(path):
+    """Return the preloaded result of a file, waiting for it if it is still loading, or None if it was not preloaded."""
+    future = _preloaded.pop(path, None)
+    if future is None:
+        return None
+    try:
+        return future.result()
+    except Exception as e:
+        print(f"Warning: Preloading {path} failed, loading it directly: {e}")
+        return None
+
+
+def asset_path(image_path):
+    """Resolve a path relative to the Assets folder (absolute paths are kept) to a normalized absolute path."""
+    return _normalize(os.path.join(ASSETS_DIR, image_path))
+
+
+def get_pixmap(image_path, size=None):
+    """
+    Return the decoded pixmap of an asset, loading it from disk only the first time.
+
+    Parameters:
+    - image_path (str): Path relative to the Assets folder, or an absolute path.
+    - size (tuple): Optional (width, height) to scale to, keeping the aspect ratio. Each size is cached separately.
+
+    Returns:
+    QPixmap: A shared pixmap. QPixmap is implicitly shared, so handing it to several widgets does not copy it.
+    """
+    key = (asset_path(image_path), tuple(size) if size else None)
+    pixmap = _pixmaps.get(key)
+    if pixmap is not None:
+        _stats["hits"] += 1
+        return pixmap
+
+    _stats["misses"] += 1
+    if size:
+        pixmap = get_pixmap(image_path).scaled(size[0], size[1], aspectRatioMode=Qt.KeepAspectRatio, transformMode=Qt.SmoothTransformation)
+    else:
+        image = _take_preloaded(key[0])
+        pixmap = QPixmap.fromImage(image) if image is not None and not image.isNull() else QPixmap(key[0])
+        if pixmap.isNull():
+            print(f"Warning: Could not load image {key[0]}")
+    _pixmaps[key] = pixmap
+    return pixmap
+
+
+def get_font_family(font_path):
+    """
+    Register a font file with the application once and return its family name.
+
+    Returns:
+    str: The family name, or None if the font could not be loaded.
+    """
+    key = _normalize(font_path)
+    if key in _font_families:
+        _stats["hits"] += 1
+        return _font_families[key]
+
+    _stats["misses"] += 1
+    data = _take_preloaded(key)
+    font_id = QFontDatabase.addApplicationFontFromData(data) if data else QFontDatabase.addApplicationFont(key)
+    families = QFontDatabase.applicationFontFamilies(font_id) if font_id != -1 else []
+    if not families:
+        print(f"Warning: Could not load font {key}")
+    _font_families[key] = families[0] if families else None
+    return _font_families[key]
+
+
+def get_file_data(path):
+    """Return the contents of a file, e.g. a GIF for QMovie, reading it from disk only the first time."""
+    key = _normalize(path)
+    if key in _files:
+        _stats["hits"] += 1
+        return _files[key]
+
+    _stats["misses"] += 1
+    data = _take_preloaded(key)
+    if data is None:
+        with open(key, "rb") as f:
+            data = f.read()
+    _files[key] = data
+    return data
+
+
+def cache_info():
+    """Return the number of cached entries, hits and misses, e.g. to check that startup loads each asset once."""
+    return {"pixmaps": len(_pixmaps), "fonts": len(_font_families), "files": len(_files), "preloaded_unused": len(_preloaded), **_stats}
+
+
+def clear():
+    """Drop every cached pixmap and file. Registered fonts stay registered with the application."""
+    _pixmaps.clear()
+    _files.clear()
+    _preloaded.clear()
@@ -1,8 +1,6 @@
 # constants.py
-import os, json
-
-# File path for settings.json
-SETTINGS_FILE = os.path.join(os.path.dirname(__file__), "settings.json")
+import os
+from Common.settings_store import settings_store
 
 # Screen dimensions
 WINDOW_WIDTH = 1920
@@ -30,19 +28,14 @@ SOUNDFILES_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "
 
 
 def initialize_constants_from_settings():
-    """Load settings from the JSON file and update variables."""
+    """Load settings from the settings store and update variables."""
     global TEMP_REACHED_MARGIN
     global THERMOMETER_READ_FREQUENCY
 
-    if not os.path.exists(SETTINGS_FILE):
-        raise FileNotFoundError(f"Settings file not found at {SETTINGS_FILE}")
-
-    with open(SETTINGS_FILE, "r") as f:
-        settings = json.load(f)
-
     # Update variables from settings
-    TEMP_REACHED_MARGIN = settings.get("target_temp_margin", TEMP_REACHED_MARGIN)
-    THERMOMETER_READ_FREQUENCY = settings.get("thermometor_read_frequency", THERMOMETER_READ_FREQUENCY)
+    TEMP_REACHED_MARGIN = settings_store.get("target_temp_margin", TEMP_REACHED_MARGIN, cast=float)
+    THERMOMETER_READ_FREQUENCY = settings_store.get("thermometor_read_frequency", THERMOMETER_READ_FREQUENCY, cast=int)
 
-# Initialize variables at the time of import
-initialize_constants_from_settings()
\ No newline at end of file
+# Initialize variables at the time of import, and again whenever they are changed in settings.json
+initialize_constants_from_settings()
+settings_store.subscribe(lambda changed: initialize_constants_from_settings(), keys=("target_temp_margin", "thermometor_read_frequency"))
@@ -24,4 +24,21 @@ DS18B20_MLT = '28-00000b81425c'
 DS18B20_HLT = '28-00000b80bee4'
 
 # DS18B20 sensor pin
-DS18B20_PIN = 7
\ No newline at end of file
+DS18B20_PIN = 7
+
+# DS18B20 sensors keyed by vessel, read together on every thermometer tick
+DS18B20_SENSORS = {
+    'BK': DS18B20_BK,
+    'MLT': DS18B20_MLT,
+    'HLT': DS18B20_HLT,
+}
+
+# DS18B20 conversion time in milliseconds per resolution in bits
+DS18B20_CONVERSION_TIME_MS = {9: 94, 10: 188, 11: 375, 12: 750}
+DS18B20_DEFAULT_RESOLUTION = 11
+
+# sysfs directory of the 1-Wire devices
+W1_DEVICES_DIR = '/sys/bus/w1/devices'
+
+# 1-Wire bus master attribute that starts a conversion on every sensor at once
+W1_THERM_BULK_READ = '/sys/bus/w1/devices/w1_bus_master1/therm_bulk_read'
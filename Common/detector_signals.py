@@ -10,6 +10,11 @@ class DetectorSignals(QObject):
     bruce_responding = pyqtSignal()
     bruce_listening = pyqtSignal()
     bruce_quitting = pyqtSignal()
-    
+    voice_ready = pyqtSignal()  # Wake-word detection is live
+
+    def __init__(self):
+        super().__init__()
+        self.is_voice_ready = False  # Lets screens built after voice_ready was emitted show the right icon
+
 # Create ONE global instance that can be imported
 detector_signals = DetectorSignals()
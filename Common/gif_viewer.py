@@ -1,7 +1,8 @@
 #gif_viewer.py
 from PyQt5.QtWidgets import QLabel
 from PyQt5.QtGui import QMovie
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QBuffer, QByteArray, QIODevice
+from Common.asset_cache import get_file_data
 import os
 
 class GifViewer(QLabel):
@@ -29,8 +30,11 @@ class GifViewer(QLabel):
         print(f"Trying to load GIF from: {gif_path}")
         print(f"File exists: {os.path.exists(gif_path)}")
 
-        # Load the GIF
-        self.movie = QMovie(gif_path)
+        # Load the GIF from memory; the file is read once (or preloaded at startup) and shared through the asset cache
+        self.buffer = QBuffer(self)
+        self.buffer.setData(QByteArray(get_file_data(gif_path)) if os.path.exists(gif_path) else QByteArray())
+        self.buffer.open(QIODevice.ReadOnly)
+        self.movie = QMovie(self.buffer, b"gif", self)
 
         if not self.movie.isValid():
             print("Error: Failed to load GIF")  # Debugging message
@@ -0,0 +1,78 @@
+# gradient_slider.py
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtGui import QPainter, QColor, QBrush, QLinearGradient, QPainterPath
+from PyQt5.QtCore import Qt, QRect, QRectF
+
+TRACK_COLOR = "#292728"
+FILL_START_COLOR = "#F04C65"
+FILL_END_COLOR = "#F58361"
+MAX_CORNER_RADIUS = 20
+
+
+class GradientSlider(QWidget):
+    """
+    Track and gradient fill drawn under the brew screen's slider.
+
+    Replaces two stylesheet-styled frames whose stylesheet was rebuilt on every
+    value change. The brushes are built once per size; a value change only
+    repaints the strip between the old and the new end of the fill, widened by
+    the corner radius so the rounded end is redrawn too. The gradient spans the
+    whole track, so the pixels left of the changed strip stay valid.
+
+    The widget does not take input; the transparent QSlider on top of it does.
+    """
+    def __init__(self, parent, geometry, minimum=0, maximum=100, value=50):
+        """
+        Parameters:
+        - parent: QWidget parent.
+        - geometry (tuple): (x, y, width, height) of the track.
+        - minimum (int), maximum (int): The value range the fill width is scaled to.
+        - value (int): The starting value.
+        """
+        super().__init__(parent)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.value = value
+        self.track_brush = QBrush(QColor(TRACK_COLOR))
+        self.fill_brush = None  # Built for the current width in resizeEvent
+        self.setGeometry(*geometry)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+
+    def fill_width(self, value=None):
+        value = self.value if value is None else value
+        span = self.maximum - self.minimum
+        fraction = (value - self.minimum) / span if span else 0
+        return int(min(1.0, max(0.0, fraction)) * self.width())
+
+    def set_value(self, value):
+        """Move the end of the fill to `value`, repainting only the part that changes."""
+        old_width, new_width = self.fill_width(), self.fill_width(value)
+        self.value = value
+        if old_width == new_width:
+            return
+        left = max(0, min(old_width, new_width) - MAX_CORNER_RADIUS)
+        self.update(QRect(left, 0, max(old_width, new_width) - left, self.height()))
+
+    def resizeEvent(self, event):
+        gradient = QLinearGradient(0, 0, self.width(), 0)
+        gradient.setColorAt(0, QColor(FILL_START_COLOR))
+        gradient.setColorAt(1, QColor(FILL_END_COLOR))
+        self.fill_brush = QBrush(gradient)
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setClipRect(event.rect())
+        painter.setPen(Qt.NoPen)
+
+        painter.setBrush(self.track_brush)
+        painter.drawRoundedRect(QRectF(self.rect()), MAX_CORNER_RADIUS, MAX_CORNER_RADIUS)
+
+        width = self.fill_width()
+        if width > 0:
+            radius = min(width // 2, MAX_CORNER_RADIUS)
+            path = QPainterPath()
+            path.addRoundedRect(QRectF(0, 0, width, self.height()), radius, radius)
+            painter.fillPath(path, self.fill_brush)
+        painter.end()
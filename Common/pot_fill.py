@@ -0,0 +1,58 @@
+# pot_fill.py
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtGui import QPainter
+from PyQt5.QtCore import QRect
+from Common.asset_cache import get_pixmap
+
+
+class PotFill(QWidget):
+    """
+    Pot foreground that fills up from the bottom.
+
+    The image is loaded once at its original size; a fill change only moves the
+    top of the clip rectangle and repaints the strip in between, so the pixmap is
+    never resampled.
+    """
+    def __init__(self, parent, image_path, center=(0, 0)):
+        """
+        Parameters:
+        - parent: QWidget parent.
+        - image_path (str): The filename of the image in the Assets folder.
+        - center (tuple): Top-left position (x, y) of the full image, like create_image.
+        """
+        super().__init__(parent)
+        self.pixmap = get_pixmap(image_path)
+        self.fill_height = self.pixmap.height()  # Visible rows counted from the bottom
+        self.setGeometry(center[0], center[1], self.pixmap.width(), self.pixmap.height())
+
+    def set_fill(self, percentage, original_height=None):
+        """
+        Show the bottom `percentage` of the image.
+
+        Parameters:
+        - percentage (float): 0.0 to 100.0. 0 or less shows the full image.
+        - original_height (int): The height that corresponds to 100%. Defaults to the image height.
+        """
+        original_height = original_height or self.pixmap.height()
+        fill_height = int(original_height * (percentage / 100.0))
+        if fill_height <= 0:
+            fill_height = original_height
+        fill_height = min(fill_height, self.pixmap.height())
+
+        if fill_height == self.fill_height:
+            return
+
+        # Repaint only the strip between the old and the new fill level
+        old_top = self.height() - self.fill_height
+        new_top = self.height() - fill_height
+        self.fill_height = fill_height
+        self.update(QRect(0, min(old_top, new_top), self.width(), abs(old_top - new_top)))
+
+    def paintEvent(self, event):
+        top = self.height() - self.fill_height
+        visible = QRect(0, top, self.width(), self.fill_height).intersected(event.rect())
+        if visible.isEmpty():
+            return
+        painter = QPainter(self)
+        painter.drawPixmap(visible, self.pixmap, visible)
+        painter.end()
@@ -0,0 +1,129 @@
+# settings_store.py
+import os, json, time, threading
+
+SETTINGS_FILE = os.path.join(os.path.dirname(__file__), "settings.json")
+
+
+class SettingsStore:
+    """
+    In-memory copy of settings.json.
+
+    The file is parsed once and values are served from memory. A watcher thread
+    checks the file's modification time and, when it changes, reloads the file and
+    calls every subscriber with the keys whose values changed, so settings can be
+    tuned while the app is running.
+
+    Subscribers are called on the watcher thread. Code that touches widgets must
+    hand the change over to the GUI thread, e.g. through a signal.
+    """
+    def __init__(self, path=SETTINGS_FILE, poll_interval=1.0):
+        """
+        Parameters:
+        - path (str): The settings file.
+        - poll_interval (float): Seconds between modification time checks while watching.
+        """
+        self.path = path
+        self.poll_interval = poll_interval
+        self.lock = threading.Lock()
+        self.subscribers = []  # [(callback, keys or None for every key)]
+        self.values = {}
+        self.mtime = None
+        self.failed_mtime = None  # Modification time of a version that did not parse, so it is not retried every poll
+        self.watcher = None
+        self.watching = threading.Event()
+
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(f"Settings file not found at {self.path}")
+        self.reload()
+
+    def get(self, name, default=None, cast=None):
+        """
+        Return a setting, or `default` if it is missing.
+
+        Parameters:
+        - cast (type): Optional type to convert the value to, e.g. int or float. Falls back to `default` if the value does not convert.
+        """
+        value = self.values.get(name, default)
+        if cast is None or value is None:
+            return value
+        try:
+            return cast(value)
+        except (TypeError, ValueError):
+            print(f"Setting '{name}' has invalid value {value!r}, using {default!r}")
+            return default
+
+    def subscribe(self, callback, keys=None):
+        """
+        Call `callback({key: new value})` whenever settings change.
+
+        Parameters:
+        - keys (iterable): Only report these keys; the callback is not called if none of them changed.
+        """
+        with self.lock:
+            self.subscribers.append((callback, set(keys) if keys is not None else None))
+
+    def unsubscribe(self, callback):
+        with self.lock:
+            self.subscribers = [(cb, keys) for cb, keys in self.subscribers if cb != callback]
+
+    def reload(self):
+        """
+        Re-read the file if it was modified and notify subscribers of the changed keys.
+
+        Returns:
+        dict: The changed settings, empty if the file was unchanged or could not be parsed.
+        """
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+            if mtime in (self.mtime, self.failed_mtime):
+                return {}
+            with open(self.path, "r") as f:
+                values = json.load(f)
+        except (OSError, ValueError) as e:
+            # Keep the previous values, e.g. while an editor is halfway through saving; report each broken version once
+            if self.mtime is None:
+                raise
+            self.failed_mtime = mtime if isinstance(e, ValueError) else None
+            print(f"Could not reload settings, keeping the current values: {e}")
+            return {}
+
+        values.pop("__comments", None)
+        with self.lock:
+            first_load = self.mtime is None
+            self.mtime = mtime
+            changed = {key: value for key, value in values.items() if key not in self.values or self.values[key] != value}
+            self.values = values
+            subscribers = list(self.subscribers)
+
+        if first_load or not changed:
+            return changed
+
+        print(f"Settings reloaded, changed: {', '.join(changed)}")
+        for callback, keys in subscribers:
+            relevant = changed if keys is None else {key: value for key, value in changed.items() if key in keys}
+            if relevant:
+                try:
+                    callback(relevant)
+                except Exception as e:
+                    print(f"Error applying changed settings in {callback}: {e}")
+        return changed
+
+    def start_watching(self):
+        """Start the thread that reloads the file when it changes."""
+        if self.watcher and self.watcher.is_alive():
+            return
+        self.watching.set()
+        self.watcher = threading.Thread(target=self.watch_loop, name="settings-watcher", daemon=True)
+        self.watcher.start()
+
+    def stop_watching(self):
+        self.watching.clear()
+
+    def watch_loop(self):
+        while self.watching.is_set():
+            self.reload()
+            time.sleep(self.poll_interval)
+
+
+# Create ONE global instance that can be imported
+settings_store = SettingsStore()
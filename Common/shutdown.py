@@ -3,6 +3,7 @@ from Common.utils_rpi import set_gpio_low, stop_pwm_signal
 import Common.constants_rpi as constants_rpi
 from Common.config import IS_RPI
 import Common.variables as variables
+from Common.DutyCycleWriter import duty_cycle_writer
 
 
 if (IS_RPI):
@@ -21,6 +22,9 @@ def perform_shutdown():
     set_gpio_low(constants_rpi.RPI_GPIO_PIN_P1)
     set_gpio_low(constants_rpi.RPI_GPIO_PIN_P2)
 
+    # Write duty cycles still waiting on the rate limit, so no pending value is lost or races GPIO.cleanup()
+    duty_cycle_writer.flush()
+
     # Stop PWM signals
     if variables.BK_PWM:
         stop_pwm_signal(variables.BK_PWM)
@@ -0,0 +1,264 @@
+# sound_service.py
+import os, time, queue, threading
+from Common.constants import SOUNDFILES_DIR
+
+SOUND_EXTENSIONS = (".mp3", ".wav", ".ogg")
+MIXER_BUFFER = 512  # Samples per mixer buffer; small so a sound starts within a few ms
+MIXER_CHANNELS = 8  # Channel 0 is reserved for speech, the rest play sounds from the bank
+
+# Priorities of sounds from the bank. When every channel is busy, a sound replaces the lowest-priority one playing below it.
+PRIORITY_UI = 0     # Button feedback and prompts
+PRIORITY_ALERT = 1  # Equipment alerts, e.g. a temperature reached or the power limit; these duck speech
+
+SPEECH_DUCK_VOLUME = 0.35  # Speech volume multiplier while an alert plays
+END_CHECK_INTERVAL = 0.01  # Seconds between end checks when a sound outlives its expected length, e.g. due to mixer latency
+
+
+class Playback:
+    """
+    Handle of one queued sound. `done` is set when it has finished, was interrupted, or could not be played.
+    """
+    def __init__(self, name, volume, priority):
+        self.name = name
+        self.volume = volume
+        self.priority = priority
+        self.done = threading.Event()
+        self.channel = None
+        self.end_time = None  # time.monotonic() at which the sound is expected to have finished
+
+    def wait(self, timeout=None):
+        """Block until the sound has finished. Returns False on timeout."""
+        return self.done.wait(timeout)
+
+
+class SoundService:
+    """
+    The app's one audio output: alert sounds and assistant speech, mixed on a single long-lived mixer.
+
+    A playback thread opens the output device once and decodes every file in the
+    sound folder before serving requests, so playing a sound is only a queue put for
+    the caller and a mix-in of an already decoded buffer for the thread. The caller
+    never waits for the device, the disk or the decoder.
+
+    Speech plays on its own reserved channel, so alerts never have to wait for it
+    or cut it off; while an alert plays, the speech is ducked. Each request returns
+    a Playback whose `done` event is set when the sound ends. The thread knows each
+    sound's length, so it sleeps until the next expected end instead of polling.
+
+    pygame is imported by the playback thread, so it stays out of startup.
+    """
+    def __init__(self, sound_dir=SOUNDFILES_DIR):
+        self.sound_dir = sound_dir
+        self.requests = queue.Queue()  # (Playback, sound or None to look it up in the bank, is speech), or None to stop
+        self.sounds = {}  # {filename: pygame.mixer.Sound}
+        self.thread = None
+        self.lock = threading.Lock()
+        self.ready = threading.Event()  # Set once the mixer is open and the bank is decoded, or opening failed
+        self.available = False  # Whether the mixer could be opened
+        self.playing = []  # Playbacks on the sound channels, owned by the playback thread
+        self.speech = None  # Playback on the speech channel
+        self.speech_channel = None
+        self.sound_channels = []  # Channels 1 and up, for sounds from the bank
+
+    def start(self):
+        """Start the playback thread, which opens the mixer and decodes the sound bank."""
+        with self.lock:
+            if self.thread and self.thread.is_alive():
+                return
+            self.thread = threading.Thread(target=self.run, name="sound-playback", daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        self.requests.put(None)
+
+    def wait_until_ready(self, timeout=None):
+        """Start the service if needed and wait until the mixer is open. Returns whether it is usable."""
+        self.start()
+        self.ready.wait(timeout)
+        return self.available
+
+    def play(self, filename, volume=1.0, priority=PRIORITY_UI):
+        """
+        Queue a sound from the sound folder and return immediately.
+
+        Parameters:
+        - filename (str): The name of the audio file.
+        - volume (float): Volume multiplier (0.0 to 1.0) for this playback.
+        - priority (int): PRIORITY_UI or PRIORITY_ALERT.
+
+        Returns:
+        Playback: Its `done` event is set when the sound has finished.
+        """
+        self.start()
+        playback = Playback(filename, volume, priority)
+        self.requests.put((playback, None, False))
+        return playback
+
+    def say(self, path, volume=1.0):
+        """
+        Decode a speech file on the calling thread and queue it on the speech channel, replacing any speech still playing.
+
+        Returns:
+        Playback: Its `done` event is set when the speech has finished, or straight away if there is no audio output.
+        """
+        playback = Playback(os.path.basename(str(path)), volume, None)
+        if not self.wait_until_ready(timeout=5):
+            print(f"Error playing speech: no audio output for '{playback.name}'")
+            playback.done.set()
+            return playback
+
+        import pygame
+        try:
+            sound = pygame.mixer.Sound(str(path))  # Read whole, so the file is not held open while it plays
+        except Exception as e:
+            print(f"Error decoding speech '{playback.name}': {e}")
+            playback.done.set()
+            return playback
+        self.requests.put((playback, sound, True))
+        return playback
+
+    def run(self):
+        try:
+            # pygame is imported on the playback thread rather than at startup
+            import pygame
+            pygame.mixer.pre_init(buffer=MIXER_BUFFER)
+            pygame.mixer.init()
+            pygame.mixer.set_num_channels(MIXER_CHANNELS)
+            self.speech_channel = pygame.mixer.Channel(0)
+            self.sound_channels = [pygame.mixer.Channel(i) for i in range(1, MIXER_CHANNELS)]  # Never the speech channel
+            self.available = True
+            self.load_bank()
+        except Exception as e:
+            print(f"Error opening audio output: {e}")
+        finally:
+            self.ready.set()
+
+        while True:
+            # Sleep until a request arrives or the next sound is due to end
+            end_times = [playback.end_time for playback in self.active_playbacks()]
+            timeout = max(0, min(end_times) - time.monotonic()) if end_times else None
+            try:
+                request = self.requests.get(timeout=timeout)
+            except queue.Empty:
+                request = False
+
+            if request is None:
+                break
+            if request:
+                playback, sound, is_speech = request
+                try:
+                    if is_speech:
+                        self.start_speech(playback, sound)
+                    else:
+                        self.start_sound(playback)
+                except Exception as e:
+                    print(f"Error playing audio: {e}")
+                    playback.done.set()
+
+            self.finish_ended()
+            self.update_ducking()
+
+        for playback in self.active_playbacks():
+            playback.done.set()
+
+    def active_playbacks(self):
+        return self.playing + ([self.speech] if self.speech else [])
+
+    def start_sound(self, playback):
+        if not self.available:
+            print(f"Error playing audio: no audio output for '{playback.name}'")
+            playback.done.set()
+            return
+        sound = self.sounds.get(playback.name) or self.load_sound(playback.name)
+        if sound is None:
+            playback.done.set()
+            return
+
+        channel = self.free_channel(playback.priority)
+        if channel is None:
+            print(f"Not playing '{playback.name}': every channel is busy with sounds of the same or higher priority")
+            playback.done.set()
+            return
+
+        # The decoded Sound is shared, so the volume is set per playback on its channel
+        channel.play(sound)
+        channel.set_volume(playback.volume)
+        playback.channel = channel
+        playback.end_time = time.monotonic() + sound.get_length()
+        self.playing.append(playback)
+        print(f"Playing: {playback.name} at volume {playback.volume}")
+
+    def free_channel(self, priority):
+        """Return an idle sound channel, or the channel of the lowest-priority sound playing below `priority`, stopping it."""
+        # Searched here rather than with pygame.mixer.find_channel(), which ignores reserved channels and would hand out the speech channel
+        for channel in self.sound_channels:
+            if not channel.get_busy():
+                return channel
+        lowest = min(self.playing, key=lambda playback: playback.priority, default=None)
+        if lowest is None or lowest.priority >= priority:
+            return None
+        lowest.channel.stop()
+        self.playing.remove(lowest)
+        lowest.done.set()
+        return lowest.channel
+
+    def start_speech(self, playback, sound):
+        if self.speech:
+            self.speech_channel.stop()
+            self.speech.done.set()
+        # A bank sound on the speech channel is cut off by the speech; finish it now rather than when the speech ends
+        for cut_off in [bank_playback for bank_playback in self.playing if bank_playback.channel is self.speech_channel]:
+            self.playing.remove(cut_off)
+            cut_off.done.set()
+        self.speech_channel.play(sound)
+        playback.channel = self.speech_channel
+        playback.end_time = time.monotonic() + sound.get_length()
+        self.speech = playback
+
+    def finish_ended(self):
+        """Set the done event of every sound that has ended, checking the channel once its expected length has passed."""
+        now = time.monotonic()
+        for playback in self.active_playbacks():
+            if playback.end_time > now:
+                continue
+            if playback.channel.get_busy():
+                playback.end_time = now + END_CHECK_INTERVAL  # Still draining the mixer buffer
+                continue
+            playback.done.set()
+            if playback is self.speech:
+                self.speech = None
+            else:
+                self.playing.remove(playback)
+
+    def update_ducking(self):
+        """Lower the speech while an alert plays, and restore it afterwards."""
+        if not self.speech:
+            return
+        ducked = any(playback.priority >= PRIORITY_ALERT for playback in self.playing)
+        self.speech_channel.set_volume(self.speech.volume * (SPEECH_DUCK_VOLUME if ducked else 1.0))
+
+    def load_bank(self):
+        """Decode every sound file in the sound folder into memory."""
+        start_time = time.perf_counter()
+        for filename in sorted(os.listdir(self.sound_dir)):
+            if filename.lower().endswith(SOUND_EXTENSIONS):
+                self.load_sound(filename)
+        print(f"Sound bank: decoded {len(self.sounds)} sounds in {(time.perf_counter() - start_time) * 1000:.0f} ms")
+
+    def load_sound(self, filename):
+        """Decode one file and add it to the bank. Returns None if it does not exist or cannot be decoded."""
+        import pygame
+        file_path = os.path.join(self.sound_dir, filename)
+        if not os.path.exists(file_path):
+            print(f"Error: File '{filename}' not found in {self.sound_dir}")
+            return None
+        try:
+            self.sounds[filename] = pygame.mixer.Sound(file_path)
+        except Exception as e:
+            print(f"Error decoding audio '{filename}': {e}")
+            return None
+        return self.sounds[filename]
+
+
+# Create ONE global instance that can be imported
+sound_service = SoundService()
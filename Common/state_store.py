@@ -0,0 +1,119 @@
+# state_store.py
+import threading
+
+
+class StateStore:
+    """
+    Shared brewing state: temperatures, setpoints, duty cycles and on/off flags.
+
+    The GUI thread, the thermometer thread and the voice assistant thread all read
+    and write it. Every write takes the lock, applies all of its changes at once
+    and bumps the version, so a snapshot never mixes values from two writes.
+    Subscribers are called with only the keys that actually changed, instead of
+    having to poll and compare everything.
+
+    Subscribers are called on the writing thread, after the lock is released.
+    Code that touches widgets must hand the change over to the GUI thread, e.g.
+    through a signal. The version passed along lets a subscriber drop a delta that
+    arrives after a newer one.
+    """
+    def __init__(self, values):
+        """
+        Parameters:
+        - values (dict): The keys of the store and their starting values. Only these keys can be set.
+        """
+        self.lock = threading.Lock()
+        self.values = dict(values)
+        self.version = 0
+        self.subscribers = []  # [(callback, keys or None for every key)]
+
+    def __contains__(self, name):
+        return name in self.values
+
+    def get(self, name):
+        return self.values[name]  # A single dict read is atomic
+
+    def snapshot(self):
+        """
+        Read every value at once.
+
+        Returns:
+        tuple: (version, dict) with a copy of all values as of that version.
+        """
+        with self.lock:
+            return self.version, dict(self.values)
+
+    def update(self, changes=None, **kwargs):
+        """
+        Set one or more values in a single atomic write and notify subscribers of the ones that changed.
+
+        Returns:
+        int: The version after the write. Unchanged if no value actually changed.
+        """
+        changes = dict(changes or {}, **kwargs)
+        unknown = set(changes) - set(self.values)
+        if unknown:
+            raise KeyError(f"Unknown state: {', '.join(sorted(unknown))}")
+
+        with self.lock:
+            changed = {key: value for key, value in changes.items() if self.values[key] != value}
+            if not changed:
+                return self.version
+            self.values.update(changed)
+            self.version += 1
+            version = self.version
+            subscribers = list(self.subscribers)
+
+        for callback, keys in subscribers:
+            relevant = changed if keys is None else {key: value for key, value in changed.items() if key in keys}
+            if relevant:
+                try:
+                    callback(relevant, version)
+                except Exception as e:
+                    print(f"Error in state subscriber {callback}: {e}")
+        return version
+
+    def subscribe(self, callback, keys=None):
+        """
+        Call `callback({key: new value}, version)` after every write that changes state.
+
+        Parameters:
+        - keys (iterable): Only report these keys; the callback is not called if none of them changed.
+        """
+        with self.lock:
+            self.subscribers.append((callback, set(keys) if keys is not None else None))
+
+    def unsubscribe(self, callback):
+        with self.lock:
+            self.subscribers = [(cb, keys) for cb, keys in self.subscribers if cb != callback]
+
+
+class StateFlags:
+    """
+    Dict-like view of the on/off flags in a StateStore, so `STATE['BK_ON'] = True` writes through the store.
+    """
+    def __init__(self, store, keys):
+        self.store = store
+        self.keys = tuple(keys)
+
+    def __contains__(self, key):
+        return key in self.keys
+
+    def __getitem__(self, key):
+        if key not in self.keys:
+            raise KeyError(key)
+        return self.store.get(key)
+
+    def __setitem__(self, key, value):
+        if key not in self.keys:
+            raise KeyError(key)
+        self.store.update({key: value})
+
+    def get(self, key, default=None):
+        return self[key] if key in self.keys else default
+
+    def items(self):
+        return [(key, self.store.get(key)) for key in self.keys]
+
+    def __repr__(self):
+        return repr(dict(self.items()))
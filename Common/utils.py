@@ -1,14 +1,16 @@
 # utils.py
 from PyQt5.QtWidgets import QLabel, QSlider, QPushButton, QGraphicsOpacityEffect
 from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QPixmap, QFontMetrics, QFontDatabase, QFont, QIcon, QLinearGradient, QBrush, QPainter, QPen, QColor
+from PyQt5.QtGui import QFontMetrics, QFont, QIcon, QLinearGradient, QBrush, QPainter, QPen, QColor
 from Common.utils_rpi import set_gpio_high, set_gpio_low
 import Common.constants_rpi as constants_rpi
 from PyQt5 import QtWidgets, QtCore
-import os, pygame
+import os
 from Common.config import RUNNING_ON_LAPTOP
-from Common.constants import SOUNDFILES_DIR
+from Common.sound_service import sound_service, PRIORITY_UI, PRIORITY_ALERT
 import Common.variables as variables
+from Common.asset_cache import get_pixmap, get_font_family, FONT_PATH
+from Common.detector_signals import detector_signals
 
 def create_label(parent_widget, text, color='white', gradient_colors=None, size=40, center=(0, 0), width=None, height=None, alignment=Qt.AlignCenter):
     """
@@ -121,19 +123,11 @@ def create_image(parent_widget, image_path, center=(0, 0), size=None):
     Returns:
     QLabel: The configured QLabel object displaying the image.
     """
-    # Automatically resolve the image path relative to the Assets folder
-    base_path = os.path.join(os.path.dirname(__file__), "..", "Assets")
-    absolute_path = os.path.join(base_path, image_path)
-
     # Create the QLabel
     image_label = QLabel(parent_widget)
 
-    # Load the image
-    pixmap = QPixmap(absolute_path)
-
-    # Resize the image if size is specified
-    if size:
-        pixmap = pixmap.scaled(size[0], size[1], aspectRatioMode=Qt.KeepAspectRatio, transformMode=Qt.SmoothTransformation)
+    # Get the image, resized if size is specified, from the shared asset cache (path relative to the Assets folder)
+    pixmap = get_pixmap(image_path, size)
 
     # Set the pixmap on the label
     image_label.setPixmap(pixmap)
@@ -274,9 +268,7 @@ def create_button(parent_widget, position=(0, 0), size=(100, 50), image_path=Non
 
     # Set an image for the button if provided
     if image_path:
-        base_path = os.path.join(os.path.dirname(__file__), "..", "Assets")
-        absolute_path = os.path.join(base_path, image_path)
-        pixmap = QPixmap(absolute_path)
+        pixmap = get_pixmap(image_path)
 
         # Use the size of the image if specified
         button.setGeometry(position[0], position[1], pixmap.width(), pixmap.height())
@@ -344,18 +336,31 @@ def set_images_visibility(static_elements, image_keys, visible):
                 element.hide()
 
 
+def connect_voice_icon(static_elements):
+    """
+    Show the lit voice icon instead of the grey one once wake-word detection is live.
+
+    Parameters:
+    - static_elements (dict): The screen's static elements, with 'IMG_Sidebar_Voicelines_Grey' and 'IMG_Sidebar_Voicelines'.
+    """
+    def show_ready_icon():
+        static_elements['IMG_Sidebar_Voicelines_Grey'].hide()
+        static_elements['IMG_Sidebar_Voicelines'].show()
+
+    if detector_signals.is_voice_ready:
+        show_ready_icon()
+    else:
+        static_elements['IMG_Sidebar_Voicelines'].hide()
+        detector_signals.voice_ready.connect(show_ready_icon)
+
 def load_custom_font():
     """
     Loads the Cascadia Code Bold font from a .ttf file and sets it as the default font.
     """
-    # Use the bold font file
-    font_path = os.path.join(os.path.dirname(__file__), "CascadiaCode.ttf")
-    
-    # Add the font to the application
-    font_id = QFontDatabase.addApplicationFont(font_path)
-
-    # Retrieve the font family and create the font object
-    font_family = QFontDatabase.applicationFontFamilies(font_id)[0]
+    # The bold font file is registered with the application only once; every call gets its own QFont to modify
+    font_family = get_font_family(FONT_PATH)
+    if font_family is None:
+        return None
 
     return QFont(font_family)
 
@@ -411,41 +416,6 @@ def set_variable(variable_name, globals_dict, desired_value):
     else:
         print(f"{variable_name} does not exist in the provided scope.")
 
-def adjust_image_height(image_label, percentage, original_height):
-    """
-    Adjust the height of an image based on a percentage of a given original height without maintaining the aspect ratio,
-    ensuring the height is reduced or increased from the top-center of the image.
-
-    Parameters:
-    - image_label (QLabel): The QLabel displaying the image.
-    - percentage (float): The percentage (0.0 to 100.0) to adjust the height.
-                          A value of 100 means the original height.
-    - original_height (int): The reference height for the percentage calculation.
-    """
-    if not isinstance(image_label, QLabel) or image_label.pixmap() is None:
-        print("Invalid image label or no pixmap set.")
-        return
-
-    # Get the original pixmap and its width
-    pixmap = image_label.pixmap()
-    original_width = pixmap.width()
-
-    # Calculate the new height based on the percentage and given original height
-    new_height = int(original_height * (percentage / 100.0))
-    if new_height <= 0:
-        new_height = original_height
-
-    # Resize the pixmap to the original width and the new height
-    resized_pixmap = pixmap.scaled(original_width, new_height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
-
-    # Set the resized pixmap back to the label
-    image_label.setPixmap(resized_pixmap)
-
-    # Calculate the new position for the QLabel to keep the top-center alignment
-    current_geometry = image_label.geometry()
-    new_top = current_geometry.top() + (current_geometry.height() - new_height)
-    image_label.setGeometry(current_geometry.left(), new_top, resized_pixmap.width(), resized_pixmap.height())
-
 def update_gpio_state(variable_name, new_value):
     """
     Updates the GPIO state based on the variable name.
@@ -510,32 +480,22 @@ def set_label_text_color(label, color):
     label.gradient_colors = None
     label.setStyleSheet(f"{current_style} {new_style}")
 
-def play_audio(filename, volume=1.0, override_bruce=False):
+def play_audio(filename, volume=1.0, override_bruce=False, priority=PRIORITY_UI):
     """
     Plays an audio file with volume adjustment.
 
+    The sound is played from memory by the sound service's playback thread, so this returns immediately.
+
     Args:
         filename (str): The name of the audio file.
         volume (float): Volume multiplier (e.g., 1.5 for 50% louder).
         override_bruce (bool): Whether to override Bruce's speaking.
-    """
-    file_path = os.path.join(SOUNDFILES_DIR, filename)
-    
-    if not os.path.exists(file_path):
-        print(f"Error: File '{filename}' not found in {SOUNDFILES_DIR}")
-        return
-    
-    try:
-        if variables.talking_with_chat and not override_bruce:
-            return
-        
-        pygame.mixer.init()
-        sound = pygame.mixer.Sound(file_path)
+        priority (int): PRIORITY_ALERT for equipment alerts. Alerts always play, ducking Bruce's speech.
 
-        sound.set_volume(volume)
-        sound.play()
-
-        print(f"Playing: {filename} at volume {volume}")
+    Returns:
+        Playback: Handle whose `done` event is set when the sound has finished, or None if the sound was skipped.
+    """
+    if variables.talking_with_chat and not override_bruce and priority < PRIORITY_ALERT:
+        return None
 
-    except Exception as e:
-        print(f"Error playing audio: {e}")
\ No newline at end of file
+    return sound_service.play(filename, volume, priority)
\ No newline at end of file
@@ -100,6 +100,33 @@ def change_pwm_duty_cycle(pwm, duty_cycle):
         print(f"{pwm} duty cycle changed to {duty_cycle}% (simulated).")
 
 
+def set_ds18b20_resolution(serial_code, resolution):
+    """
+    Writes the conversion resolution of a DS18B20 sensor.
+
+    Args:
+        serial_code (str): The sensor's serial code.
+        resolution (str): The resolution value to write (e.g. "9" for 9-bit).
+
+    Returns:
+        bool: True if the resolution was written.
+    """
+    if IS_RPI:
+        resolution_file = os.path.join(constants_rpi.W1_DEVICES_DIR, serial_code, "resolution")
+        if not os.path.exists(resolution_file):
+            print(f"Resolution file for sensor {serial_code} not found.")
+            return False
+        try:
+            with open(resolution_file, "w") as f:
+                f.write(resolution)
+            return True
+        except Exception as e:
+            print(f"Warning: Unable to set sensor {serial_code} resolution: {e}")
+            return False
+    else:
+        print(f"Sensor {serial_code} resolution set to {resolution}-bit (simulated).")
+        return True
+
 def initialize_ds18b20_resolution(serial_code, resolution="9"):
     """
     Sets the resolution of a DS18B20 sensor once at startup.
@@ -108,18 +135,56 @@ def initialize_ds18b20_resolution(serial_code, resolution="9"):
         serial_code (str): The sensor's serial code.
         resolution (str): The resolution value to write (e.g. "9" for 9-bit).
     """
-    if IS_RPI:
-        sensor_dir = f"/sys/bus/w1/devices/{serial_code}"
-        resolution_file = os.path.join(sensor_dir, "resolution")
-        if os.path.exists(resolution_file):
-            try:
-                with open(resolution_file, "w") as f:
-                    f.write(resolution)
-                print(f"Sensor {serial_code} resolution set to {resolution}-bit.")
-            except Exception as e:
-                print(f"Warning: Unable to set sensor {serial_code} resolution: {e}")
-        else:
-            print(f"Resolution file for sensor {serial_code} not found.")
+    if IS_RPI and set_ds18b20_resolution(serial_code, resolution):
+        print(f"Sensor {serial_code} resolution set to {resolution}-bit.")
+
+class DS18B20Reader:
+    """
+    Reads one DS18B20 sensor through a sysfs file descriptor that stays open.
+
+    The kernel's `temperature` attribute is used when it exists, since the driver
+    has already checked the CRC; otherwise `w1_slave` is parsed. Each read re-reads
+    the attribute from offset 0 into the same buffer and parses the bytes in place.
+    """
+    def __init__(self, serial_code, devices_dir=constants_rpi.W1_DEVICES_DIR):
+        self.serial_code = serial_code
+        sensor_dir = os.path.join(devices_dir, serial_code)
+        temperature_path = os.path.join(sensor_dir, "temperature")
+        self.uses_temperature_attribute = os.path.exists(temperature_path)
+        self.path = temperature_path if self.uses_temperature_attribute else os.path.join(sensor_dir, "w1_slave")
+        self.fd = os.open(self.path, os.O_RDONLY)
+        self.buffer = bytearray(128)
+
+    def read(self):
+        """
+        Returns:
+            float: The temperature in Celsius.
+
+        Raises:
+            ValueError: If the CRC check failed or no temperature was found.
+        """
+        length = os.preadv(self.fd, [self.buffer], 0)
+        buffer = self.buffer
+
+        if self.uses_temperature_attribute:
+            return int(buffer[:length]) / 1000.0
+
+        # w1_slave: the first line ends with "YES" if the CRC matched, the second holds "t=<millidegrees>"
+        newline = buffer.find(b"\n", 0, length)
+        if newline < 3 or buffer.find(b"YES", newline - 3, newline) < 0:
+            raise ValueError("CRC check failed for DS18B20 data.")
+        value_start = buffer.find(b"t=", newline, length)
+        if value_start < 0:
+            raise ValueError("Temperature data not found.")
+        return int(buffer[value_start + 2:length]) / 1000.0
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+_ds18b20_readers = {}  # Open readers keyed by serial code
 
 def read_ds18b20(serial_code):
     """
@@ -132,29 +197,19 @@ def read_ds18b20(serial_code):
         float: The temperature in Celsius, or -1.0 on error.
     """
     if IS_RPI:
-        sensor_file_path = f"/sys/bus/w1/devices/{serial_code}/w1_slave"
-        start_time = time.time()  # Record the start time
         try:
-            with open(sensor_file_path, 'r') as f:
-                lines = f.readlines()
-
-            # Check CRC (the first line should end with "YES")
-            if lines[0].strip()[-3:] != "YES":
-                raise ValueError("CRC check failed for DS18B20 data.")
-
-            # Parse the temperature from the second line (after "t=")
-            temp_output = lines[1].split("t=")
-            if len(temp_output) < 2:
-                raise ValueError("Temperature data not found.")
-            temp_c = float(temp_output[1]) / 1000.0
-
-            end_time = time.time()  # Record the end time
-            print(f"read_ds18b20 execution time: {end_time - start_time:.3f} seconds")
-            return temp_c
+            reader = _ds18b20_readers.get(serial_code)
+            if reader is None:
+                reader = _ds18b20_readers[serial_code] = DS18B20Reader(serial_code)
+            return reader.read()
         except FileNotFoundError:
             print(f"DS18B20 sensor with serial code {serial_code} not found.")
             return -1.0
         except Exception as e:
+            # Reopen on the next read in case the sensor dropped off the bus
+            reader = _ds18b20_readers.pop(serial_code, None)
+            if reader:
+                reader.close()
             print(f"An error occurred while reading the DS18B20 sensor: {e}")
             return -1.0
     else:
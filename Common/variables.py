@@ -1,68 +1,84 @@
 # variables.py
-import json
-import os
+import sys, types
+from Common.settings_store import settings_store
+from Common.state_store import StateStore, StateFlags
 
-# File path for settings.json
-SETTINGS_FILE = os.path.join(os.path.dirname(__file__), "settings.json")
+# Default Variables. They live in one StateStore shared by the GUI, thermometer and assistant threads;
+# `variables.temp_BK` reads and `variables.temp_BK = x` writes go through it (see VariablesModule below).
+state = StateStore({
+    # Temperatures
+    "temp_BK": 100,
+    "temp_MLT": 68,
+    "temp_HLT": 70,
 
-# Default Variables
-# Temperatures
-temp_BK = 100
-temp_MLT = 68
-temp_HLT = 70
+    "temp_progress_BK": 0,
+    "temp_progress_HLT": 0,
 
-temp_progress_BK = 0
-temp_progress_HLT = 0
+    # Efficiency
+    "efficiency_BK": 100,
+    "efficiency_HLT": 36,
 
-# Efficiency
-efficiency_BK = 100
-efficiency_HLT = 36
-BK_PWM = None
-HLT_PWM = None
-
-# REG values
-temp_REG_BK = 85
-temp_REG_HLT = 70
-set_temp_reached_BK = False
-set_temp_reached_HLT = False
+    # REG values
+    "temp_REG_BK": 85,
+    "temp_REG_HLT": 70,
+    "set_temp_reached_BK": False,
+    "set_temp_reached_HLT": False,
 
-# Pump speeds
-pump_speed_P1 = 100
-pump_speed_P2 = 100
-P1_PWM = None
-P2_PWM = None
+    # Pump speeds
+    "pump_speed_P1": 100,
+    "pump_speed_P2": 100,
 
-# Active Units
-STATE = {
+    # Active Units
     "BK_ON": False,
     "HLT_ON": False,
     "P1_ON": False,
     "P2_ON": False,
-}
 
-active_variable = None
+    "active_variable": None,
+
+    #ChatGPT API
+    "talking_with_chat": False,
+})
+
+# Active Units, keyed like before; writes go through the store
+STATE = StateFlags(state, ("BK_ON", "HLT_ON", "P1_ON", "P2_ON"))
+
+# PWM handles are hardware objects owned by the GUI thread, not observable state
+BK_PWM = None
+HLT_PWM = None
+P1_PWM = None
+P2_PWM = None
+
+
+class VariablesModule(types.ModuleType):
+    """Module type that serves the names in `state` as module attributes, so existing reads and writes stay atomic."""
+    def __getattr__(self, name):
+        # Only called for names that are not regular module attributes
+        if name in state:
+            return state.get(name)
+        raise AttributeError(f"module {self.__name__!r} has no attribute {name!r}")
+
+    def __setattr__(self, name, value):
+        if name in state:
+            state.update({name: value})
+        else:
+            super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = VariablesModule
 
-#ChatGPT API
-talking_with_chat = False
 
 def initialize_variables_from_settings():
-    """Load settings from the JSON file and update variables."""
-    global temp_BK, temp_HLT, temp_REG_BK, temp_REG_HLT
-    global efficiency_BK, efficiency_HLT, pump_speed_P1, pump_speed_P2
-
-    if not os.path.exists(SETTINGS_FILE):
-        raise FileNotFoundError(f"Settings file not found at {SETTINGS_FILE}")
-
-    with open(SETTINGS_FILE, "r") as f:
-        settings = json.load(f)
-
-    # Update variables from settings
-    temp_REG_BK = settings.get("REG starting temperature BK", temp_REG_BK)
-    temp_REG_HLT = settings.get("REG starting temperature HLT", temp_REG_HLT)
-    efficiency_BK = settings.get("starting efficiency BK", efficiency_BK)
-    efficiency_HLT = settings.get("starting efficiency HLT", efficiency_HLT)
-    pump_speed_P1 = settings.get("starting efficiency P1", pump_speed_P1)
-    pump_speed_P2 = settings.get("starting efficiency P2", pump_speed_P2)
+    """Load settings from the settings store and update variables."""
+    # Update variables from settings. These are starting values only, so later changes to the file do not override them.
+    state.update(
+        temp_REG_BK=settings_store.get("REG starting temperature BK", state.get("temp_REG_BK")),
+        temp_REG_HLT=settings_store.get("REG starting temperature HLT", state.get("temp_REG_HLT")),
+        efficiency_BK=settings_store.get("starting efficiency BK", state.get("efficiency_BK")),
+        efficiency_HLT=settings_store.get("starting efficiency HLT", state.get("efficiency_HLT")),
+        pump_speed_P1=settings_store.get("starting efficiency P1", state.get("pump_speed_P1")),
+        pump_speed_P2=settings_store.get("starting efficiency P2", state.get("pump_speed_P2")),
+    )
 
 # Initialize variables at the time of import
 initialize_variables_from_settings()
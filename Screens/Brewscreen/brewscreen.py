@@ -1,22 +1,26 @@
 # brewscreen.py
 import os, math, time
-from PyQt5.QtWidgets import QMainWindow, QWidget
-from PyQt5.QtCore import Qt, QThread
-from Common.utils import toggle_images_visibility, play_audio
+from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from Common.utils import toggle_images_visibility, play_audio, connect_voice_icon
 from Screens.Brewscreen.brewscreen_static_gui import initialize_static_elements, create_slider_plus_minus_labels
 from Screens.Brewscreen.brewscreen_dynamic_gui import initialize_dynamic_elements, create_slider_value_label
 import Common.constants_gui as constants_gui
 import Common.constants as constants
 import Common.variables as variables
-from Screens.Brewscreen.brewscreen_gui_initialization import initialize_slider, initialize_buttons, hide_GUI_elements
+from Screens.Brewscreen.brewscreen_gui_initialization import initialize_slider, initialize_buttons, hide_GUI_elements, apply_duty_cycle_changes, DUTY_CYCLE_OUTPUTS, duty_cycle_writer
 from Common.ThermometerWorker import ThermometerWorker
-from Common.TemperatureGraph import TemperatureGraph
-from Screens.Graphscreen.graphscreen import GraphScreen
-from Screens.Settingsscreen.settingsscreen import SettingsScreen
-from Common.utils_rpi import change_pwm_duty_cycle, initialize_gpio
+from Screens.Brewscreen.brewscreen_presenter import BrewscreenPresenter
+from Common.TemperatureHistory import TemperatureHistory
+from Common.BrewLog import BrewLog
+from Common.get_setting import get_setting
+from Common.settings_store import settings_store
+from Screens.screen_manager import ScreenManager
+from Common.utils_rpi import initialize_gpio
 import Screens.Brewscreen.brewscreen_helpers as brewscreen_helpers
 import Screens.Brewscreen.brewscreen_events as brewscreen_events
 from Common.gif_viewer import GifViewer
+from Common.sound_service import PRIORITY_ALERT
 from Common.detector_signals import detector_signals
 from Common.bruce_gifs import start_gif, stop_gif
 from Common.max_wattage import calculate_new_total_power_consumption, power_is_within_limit, calculate_max_new_efficiency
@@ -25,7 +29,12 @@ gif_label_thinking = None
 gif_label_responding = None
 gif_label_listening = None
 
+# Variables shown in a label named TXT_<VARIABLE>, e.g. TXT_TEMP_REG_BK
+DISPLAYED_VARIABLES = ('temp_REG_BK', 'temp_REG_HLT', 'efficiency_BK', 'efficiency_HLT', 'pump_speed_P1', 'pump_speed_P2')
+
 class FullScreenWindow(QMainWindow):
+    state_changed = pyqtSignal(object)  # Deltas of variables.state, delivered in the GUI thread
+
     def __init__(self):
         super().__init__()
         self.path = os.path.join(os.path.dirname(__file__), "..", "Assets")
@@ -34,18 +43,21 @@ class FullScreenWindow(QMainWindow):
         self.active_variable = None  # Tracks the active variable being adjusted
         self.worker_thread = None  # Thread for thermometer
         self.thermometer_worker = None  # Worker instance
-        self.graph = TemperatureGraph(self)
+        self.brew_log = None  # On-disk log of the brew session
+        self.presenter = None  # Applies thermometer snapshots to the widgets
+        self.temperature_history = TemperatureHistory()  # Recorded from startup, drawn by the graph screen once it is built
 
         self.init_ui()  # Call setup functions first to initialize central_widget
-        
-        # Initialize the graph screen
-        self.graph_screen = GraphScreen()
-        self.graph_screen.hide()
-        self.graph = self.graph_screen.temperature_graph  # Reference the temperature graph from GraphScreen
 
-        self.settings_screen = None  # Placeholder for the settings window    
+        # React to changed setpoints and duty cycles, whether the slider, the assistant or anything else set them
+        self.state_changed.connect(self.on_state_changed)
+        variables.state.subscribe(lambda changes, version: self.state_changed.emit(changes), keys=DISPLAYED_VARIABLES)
+        variables.state.subscribe(apply_duty_cycle_changes, keys=DUTY_CYCLE_OUTPUTS)
 
+        self.open_brew_log()
         self.start_thermometer_thread() 
+        QApplication.instance().aboutToQuit.connect(self.stop_thermometer_thread)
+        QApplication.instance().aboutToQuit.connect(duty_cycle_writer.report_statistics)
 
         self.last_audio_play_time = 0  # Store last time audio played
         self.audio_cooldown = 1  # Cooldown in seconds
@@ -78,21 +90,64 @@ class FullScreenWindow(QMainWindow):
             self.setCursor(Qt.BlankCursor)
 
     def setup_central_widget(self):
-        self.central_widget = QWidget(self)
+        # All screens share this window; the other screens are built the first time they are shown
+        self.screen_manager = ScreenManager(self)
+        self.screen_manager.register("graph", self.create_graph_screen)
+        self.screen_manager.register("settings", self.create_settings_screen)
+        self.setCentralWidget(self.screen_manager)
+
+        self.central_widget = QWidget()
         self.central_widget.setStyleSheet(f"background-color: {constants.BACKGROUND_COLOR};")
         self.central_widget.setContentsMargins(0, 0, 0, 0)
-        self.setCentralWidget(self.central_widget)
+        self.screen_manager.add_screen("brew", self.central_widget)
+
+    def create_graph_screen(self):
+        """Build the graph screen on the shared temperature history and let the presenter redraw it."""
+        # Imported here so pyqtgraph is only loaded when the graph is first shown
+        from Screens.Graphscreen.graphscreen import GraphScreen
+        graph_screen = GraphScreen(self.screen_manager, self.temperature_history)
+        if self.presenter:
+            self.presenter.attach_graph(graph_screen.temperature_graph)
+        return graph_screen
+
+    def create_settings_screen(self):
+        from Screens.Settingsscreen.settingsscreen import SettingsScreen
+        return SettingsScreen(self.screen_manager)
+
+    def open_brew_log(self):
+        """Open the on-disk brew log and restore the graph if an interrupted session is resumed."""
+        try:
+            self.brew_log = BrewLog(
+                flush_interval=get_setting("brew_log_flush_interval"),
+                resume_window=get_setting("brew_log_resume_window")
+            )
+        except Exception as e:
+            print(f"Brew log unavailable, continuing without it: {e}")
+            self.brew_log = None
+            return
+
+        # Let the flush interval be tuned while brewing
+        settings_store.subscribe(self.on_brew_log_settings_changed, keys=("brew_log_flush_interval",))
+
+        if self.brew_log.resumed:
+            records = self.brew_log.load()
+            self.temperature_history.extend(records["time"], records["temp_bk"], records["temp_mlt"], records["temp_hlt"])
+            print(f"Restored {len(records)} samples from the brew log.")
+
+    def on_brew_log_settings_changed(self, changed):
+        """Settings subscriber; runs on the settings watcher thread."""
+        if self.brew_log:
+            self.brew_log.flush_interval = float(changed["brew_log_flush_interval"])
 
     def start_thermometer_thread(self):
         """Start the thermometer worker in a separate thread."""
         self.worker_thread = QThread()
-        self.thermometer_worker = ThermometerWorker(self.static_elements, self.graph_screen.temperature_graph)
+        self.thermometer_worker = ThermometerWorker(self.brew_log)
+        self.presenter = BrewscreenPresenter(self.central_widget, self.static_elements, self.dynamic_elements, self.temperature_history)
 
         self.thermometer_worker.moveToThread(self.worker_thread)
         self.worker_thread.started.connect(self.thermometer_worker.run)
-        self.thermometer_worker.temperature_updated_bk.connect(self.update_temperature_label_bk)
-        self.thermometer_worker.temperature_updated_mlt.connect(self.update_temperature_label_mlt)
-        self.thermometer_worker.temperature_updated_hlt.connect(self.update_temperature_label_hlt)
+        self.thermometer_worker.snapshot_ready.connect(self.presenter.submit)
         self.thermometer_worker.finished.connect(self.worker_thread.quit)
         self.thermometer_worker.finished.connect(self.thermometer_worker.deleteLater)
         self.worker_thread.finished.connect(self.worker_thread.deleteLater)
@@ -103,39 +158,15 @@ class FullScreenWindow(QMainWindow):
         """Stop the thermometer worker and thread."""
         if self.thermometer_worker:
             self.thermometer_worker.stop()
+            self.thermometer_worker = None
         if self.worker_thread:
             self.worker_thread.quit()
             self.worker_thread.wait()
-
-    def update_temperature_label_bk(self, temperature):
-        """Update the GUI with the new temperature."""
-        # Update the temperature label dynamically
-        label_key = 'TXT_TEMP_BK' 
-        if label_key in self.dynamic_elements:
-            if temperature >= 100:
-                self.dynamic_elements[label_key].setText("100°")
-            else:
-                self.dynamic_elements[label_key].setText(f"{temperature:.1f}°")
-
-    def update_temperature_label_mlt(self, temperature):
-        """Update the GUI with the new temperature."""
-        # Update the temperature label dynamically
-        label_key = 'TXT_TEMP_MLT' 
-        if label_key in self.dynamic_elements:
-            if temperature >= 100:
-                self.dynamic_elements[label_key].setText("100°")
-            else:
-                self.dynamic_elements[label_key].setText(f"{temperature:.1f}°")
-
-    def update_temperature_label_hlt(self, temperature):
-        """Update the GUI with the new temperature."""
-        # Update the temperature label dynamically
-        label_key = 'TXT_TEMP_HLT' 
-        if label_key in self.dynamic_elements:
-            if temperature >= 100:
-                self.dynamic_elements[label_key].setText("100°")
-            else:
-                self.dynamic_elements[label_key].setText(f"{temperature:.1f}°")
+            self.worker_thread = None
+        if self.brew_log:
+            settings_store.unsubscribe(self.on_brew_log_settings_changed)
+            self.brew_log.close()
+            self.brew_log = None
 
     def closeEvent(self, event):
         """Ensure threads are stopped when the application is closed."""
@@ -197,13 +228,14 @@ class FullScreenWindow(QMainWindow):
         )
 
         hide_GUI_elements(self.static_elements, self.dynamic_elements, self.buttons)
+        connect_voice_icon(self.static_elements)
 
     def initialize_slider_and_buttons(self):
         """
         Initialize the slider and buttons for the GUI.
         """
         # Initialize the slider and its related elements
-        self.slider, _, self.fake_slider, self.fake_slider_background = initialize_slider(
+        self.slider, _, self.fake_slider = initialize_slider(
             central_widget=self.central_widget,
             constants=constants,
             on_slider_change_callback=self.on_slider_change,
@@ -239,7 +271,6 @@ class FullScreenWindow(QMainWindow):
     def hide_slider_elements(self):
         self.slider.hide()
         self.fake_slider.hide()
-        self.fake_slider_background.hide()
         self.slider_value_label.hide()
         self.static_elements['TXT_Slider_0'].hide()
         self.static_elements['TXT_Slider_100'].hide()
@@ -256,7 +287,6 @@ class FullScreenWindow(QMainWindow):
     def show_slider_elements(self):
         self.slider.show()
         self.fake_slider.show()
-        self.fake_slider_background.show()
         self.slider_value_label.show()
         self.static_elements['TXT_Slider_0'].show()
         self.static_elements['TXT_Slider_100'].show()
@@ -282,7 +312,7 @@ class FullScreenWindow(QMainWindow):
                 # Cooldown check: Prevent multiple audio triggers
                 current_time = time.time()
                 if current_time - self.last_audio_play_time >= self.audio_cooldown:
-                    play_audio("max_power_consumption - Male.mp3")
+                    play_audio("max_power_consumption - Male.mp3", priority=PRIORITY_ALERT)
                     self.last_audio_play_time = current_time  # Update last played time
 
                 return
@@ -293,11 +323,16 @@ class FullScreenWindow(QMainWindow):
 
     def update_active_variable(self, value):
         if self.active_variable:
+            # The label and the PWM output follow through the state subscriptions
             setattr(variables, self.active_variable, value)
-            label_key = f'TXT_{self.active_variable.upper()}'
+
+    def on_state_changed(self, changes):
+        """Show changed setpoints and duty cycles in their labels, and on the slider if it is adjusting one."""
+        for variable_name, value in changes.items():
+            label_key = f'TXT_{variable_name.upper()}'
 
             # Determine the appropriate suffix based on the variable type
-            if 'PUMP_SPEED' in self.active_variable.upper() or 'EFFICIENCY' in self.active_variable.upper():
+            if 'PUMP_SPEED' in label_key or 'EFFICIENCY' in label_key:
                 suffix = '%'  # Percentage for pump speed
             else:
                 suffix = '°'  # Degree for temperature
@@ -307,21 +342,8 @@ class FullScreenWindow(QMainWindow):
             else:
                 print(f"Label key {label_key} not found in dynamic elements.")
 
-            # Update the REG values specifically if the active variable is temp_REG_BK or temp_REG_HLT
-            if self.active_variable == 'temp_REG_BK':
-                variables.temp_REG_BK = value
-            elif self.active_variable == 'temp_REG_HLT':
-                variables.temp_REG_HLT = value
-            elif self.active_variable == 'efficiency_BK':
-                if power_is_within_limit(calculate_new_total_power_consumption('efficiency_BK',value)):
-                    change_pwm_duty_cycle(variables.BK_PWM, value)
-            elif self.active_variable == 'efficiency_HLT':
-                if power_is_within_limit(calculate_new_total_power_consumption('efficiency_HLT',value)):
-                    change_pwm_duty_cycle(variables.HLT_PWM, value)
-            elif self.active_variable == 'pump_speed_P1':
-                change_pwm_duty_cycle(variables.P1_PWM, value)
-            elif self.active_variable == 'pump_speed_P2':
-                change_pwm_duty_cycle(variables.P2_PWM, value)
+            if variable_name == self.active_variable and self.slider.value() != int(value):
+                self.slider.setValue(int(value))
 
     def update_slider_value(self, variable_name):
         self.active_variable = variable_name  # Update the local reference
@@ -340,7 +362,7 @@ class FullScreenWindow(QMainWindow):
             # Check if the new value is within the power limit
             if not power_is_within_limit(calculate_new_total_power_consumption(self.active_variable, value)):
                 value = math.floor(calculate_max_new_efficiency(self.active_variable))
-                play_audio("max_power_consumption - Male.mp3")
+                play_audio("max_power_consumption - Male.mp3", priority=PRIORITY_ALERT)
 
         if self.active_variable is not None:
             self.slider.setValue(value)  # Set the slider value
@@ -372,14 +394,10 @@ class FullScreenWindow(QMainWindow):
         super().mousePressEvent(event)
 
     def show_graph_screen(self):
-        if not self.graph_screen:
-            self.graph_screen = GraphScreen()
-        self.graph_screen.show()
+        self.screen_manager.show_screen("graph")
 
     def show_settings_screen(self):
-        if not self.settings_screen:
-            self.settings_screen = SettingsScreen()
-        self.settings_screen.show()
+        self.screen_manager.show_screen("settings")
 
     def update_active_variable_for_selection(self, selected_key):
         """
@@ -1,9 +1,8 @@
 # brewscreen_gui_initialization.py
 from PyQt5.QtCore import Qt
-import PyQt5.QtWidgets as QtWidgets
 import Common.constants
 from Common.utils import create_slider, create_button, toggle_variable, set_variable, set_label_text_color, set_images_visibility, play_audio
-from Common.utils_rpi import set_pwm_signal, stop_pwm_signal, create_software_pwm
+from Common.utils_rpi import set_pwm_signal, stop_pwm_signal, create_software_pwm, change_pwm_duty_cycle
 from Common.variables import STATE
 from Common.constants import SLIDER_PAGESTEP
 import Common.constants_rpi as constants_rpi
@@ -11,11 +10,21 @@ import Common.constants_gui as constants_gui
 import Common.variables as variables
 from Common.shutdown import perform_shutdown
 from Common.max_wattage import calculate_new_total_power_consumption, power_is_within_limit
+from Common.DutyCycleWriter import duty_cycle_writer
+from Common.gradient_slider import GradientSlider
 
 _gui_static_elements = None
 _gui_dynamic_elements = None
 _gui_toggle_images_visibility_callback = None
 
+# Duty cycle variables and the PWM handle each one drives
+DUTY_CYCLE_OUTPUTS = {
+    'efficiency_BK': 'BK_PWM',
+    'efficiency_HLT': 'HLT_PWM',
+    'pump_speed_P1': 'P1_PWM',
+    'pump_speed_P2': 'P2_PWM',
+}
+
 def initialize_slider(central_widget, constants, on_slider_change_callback, dynamic_elements):
     # Create the real slider
     slider = create_slider(
@@ -34,31 +43,21 @@ def initialize_slider(central_widget, constants, on_slider_change_callback, dyna
     # Store the last valid value on the slider
     slider.last_valid_value = slider.value()
 
-    # Create background for the fake slider
-    fake_slider_background = QtWidgets.QFrame(central_widget)
-    fake_slider_background.setGeometry(
-        constants_gui.SLIDER_COORDINATES[0],
-        constants_gui.SLIDER_COORDINATES[1] + 15,
-        int(constants_gui.SLIDER_SIZE[0]),
-        constants_gui.SLIDER_SIZE[1] + 10
-    )
-    fake_slider_background.setStyleSheet("""
-        background-color: #292728;
-        border-radius: 20px;
-    """)
-    fake_slider_background.setAttribute(Qt.WA_TransparentForMouseEvents, True)
-    fake_slider_background.hide()
-
-    # Create the fake slider
-    fake_slider = QtWidgets.QFrame(central_widget)
-    fake_slider.setGeometry(
-        constants_gui.SLIDER_COORDINATES[0],
-        constants_gui.SLIDER_COORDINATES[1] + 15,
-        int(constants_gui.SLIDER_SIZE[0] * 0.5),
-        constants_gui.SLIDER_SIZE[1] + 10
+    # Create the painted track and fill under the real slider
+    fake_slider = GradientSlider(
+        central_widget,
+        (
+            constants_gui.SLIDER_COORDINATES[0],
+            constants_gui.SLIDER_COORDINATES[1] + 15,
+            constants_gui.SLIDER_SIZE[0],
+            constants_gui.SLIDER_SIZE[1] + 10
+        ),
+        minimum=slider.minimum(),
+        maximum=slider.maximum(),
+        value=slider.value()
     )
 
-    def update_border_radius(value):
+    def update_fake_slider(value):
         # Check if we're updating an efficiency value and if the new power is allowed
         if variables.active_variable in ['efficiency_BK', 'efficiency_HLT']:
             new_total_power = calculate_new_total_power_consumption(variables.active_variable, value)
@@ -71,31 +70,17 @@ def initialize_slider(central_widget, constants, on_slider_change_callback, dyna
         # Otherwise, update last_valid_value to this acceptable value
         slider.last_valid_value = value
 
-        # Proceed with updating the fake slider
-        max_width = constants_gui.SLIDER_SIZE[0]
-        new_width = int((value / slider.maximum()) * max_width)
-        border_radius = min(new_width // 2, 20)
-        fake_slider.setStyleSheet(f"""
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                        stop:0 #F04C65, stop:1 #F58361);
-            border-radius: {border_radius}px;
-        """)
-        fake_slider.setGeometry(
-            fake_slider.geometry().x(),
-            fake_slider.geometry().y(),
-            new_width,
-            fake_slider.geometry().height()
-        )
+        # Proceed with updating the fake slider; only the changed part of the fill is repainted
+        fake_slider.set_value(value)
 
     # Connect the valueChanged signal to update the fake slider
-    slider.valueChanged.connect(update_border_radius)
+    slider.valueChanged.connect(update_fake_slider)
 
-    fake_slider.setAttribute(Qt.WA_TransparentForMouseEvents, True)
     fake_slider.hide()
 
     value_label = dynamic_elements.get('TXT_SLIDER_VALUE', None)
 
-    return slider, value_label, fake_slider, fake_slider_background
+    return slider, value_label, fake_slider
 
 def initialize_buttons(central_widget, static_elements, dynamic_elements, toggle_images_visibility_callback, select_button_callback, show_graph_screen_callback, show_settings_screen_callback, instance):
     """
@@ -107,6 +92,7 @@ def initialize_buttons(central_widget, static_elements, dynamic_elements, toggle
     - static_elements: Dictionary of static elements for the GUI.
     - toggle_images_visibility_callback: Function to toggle visibility of images.
     - select_button_callback: Function to handle button selection logic.
+    - instance: The FullScreenWindow the buttons act on.
 
     Returns:
     A dictionary of initialized buttons.
@@ -125,7 +111,7 @@ def initialize_buttons(central_widget, static_elements, dynamic_elements, toggle
             size=constants_gui.BTN_POT_ON_OFF,
             on_normal_click=lambda: (
                 select_button_callback(instance, 'IMG_BK_Selected', 'TXT_EFFICIENCY_BK'),  # Pass self explicitly
-                central_widget.parent().update_slider_value('efficiency_BK')  # Update slider for BK
+                instance.update_slider_value('efficiency_BK')  # Update slider for BK
             ),
             on_long_click=lambda: toggle_pot_handle_all('BK'),
             invisible=Common.constants.BTN_INVISIBILITY
@@ -136,7 +122,7 @@ def initialize_buttons(central_widget, static_elements, dynamic_elements, toggle
             size=constants_gui.BTN_POT_ON_OFF,
             on_normal_click=lambda: (
                 select_button_callback(instance, 'IMG_HLT_Selected', 'TXT_EFFICIENCY_HLT'),
-                central_widget.parent().update_slider_value('efficiency_HLT')  # Update slider for HLT
+                instance.update_slider_value('efficiency_HLT')  # Update slider for HLT
             ),
             on_long_click=lambda: toggle_pot_handle_all('HLT'),
             invisible=Common.constants.BTN_INVISIBILITY
@@ -147,7 +133,7 @@ def initialize_buttons(central_widget, static_elements, dynamic_elements, toggle
             size=constants_gui.BTN_PUMP_ON_OFF,
             on_normal_click=lambda: (
                 select_button_callback(instance, 'IMG_P1_Selected', 'TXT_P1'),
-                central_widget.parent().update_slider_value('pump_speed_P1')  # Update slider for P1
+                instance.update_slider_value('pump_speed_P1')  # Update slider for P1
             ),
             on_long_click=lambda: toggle_pump_handle_all('P1'),
             invisible=Common.constants.BTN_INVISIBILITY
@@ -158,7 +144,7 @@ def initialize_buttons(central_widget, static_elements, dynamic_elements, toggle
             size=constants_gui.BTN_PUMP_ON_OFF,
             on_normal_click=lambda: (
                 select_button_callback(instance, 'IMG_P2_Selected', 'TXT_P2'),
-                central_widget.parent().update_slider_value('pump_speed_P2')  # Update slider for P2
+                instance.update_slider_value('pump_speed_P2')  # Update slider for P2
             ),
             on_long_click=lambda: toggle_pump_handle_all('P2'),
             invisible=Common.constants.BTN_INVISIBILITY
@@ -169,7 +155,7 @@ def initialize_buttons(central_widget, static_elements, dynamic_elements, toggle
             size=constants_gui.BTN_REG_ON_OFF,
             on_normal_click=lambda: (
                 select_button_callback(instance, 'IMG_REGBK_Selected', 'TXT_REG_BK'),
-                central_widget.parent().update_slider_value('temp_REG_BK')  # Update slider for BK
+                instance.update_slider_value('temp_REG_BK')  # Update slider for BK
             ),
             on_long_click=None,
             invisible=Common.constants.BTN_INVISIBILITY
@@ -180,7 +166,7 @@ def initialize_buttons(central_widget, static_elements, dynamic_elements, toggle
             size=constants_gui.BTN_REG_ON_OFF,
             on_normal_click=lambda: (
                 select_button_callback(instance, 'IMG_REGHLT_Selected', 'TXT_REG_HLT'),
-                central_widget.parent().update_slider_value('temp_REG_HLT')  # Update slider for HLT
+                instance.update_slider_value('temp_REG_HLT')  # Update slider for HLT
             ),
             on_long_click=None,
             invisible=Common.constants.BTN_INVISIBILITY
@@ -205,7 +191,7 @@ def initialize_buttons(central_widget, static_elements, dynamic_elements, toggle
             parent_widget=central_widget,
             position=constants_gui.BTN_SLIDER_SET_MIN_COORDINATES,
             size=constants_gui.BTN_SLIDER_SET_MINMAX,
-            on_normal_click=lambda: central_widget.parent().set_slider_value(0),
+            on_normal_click=lambda: instance.set_slider_value(0),
             on_long_click=None,
             invisible=Common.constants.BTN_INVISIBILITY
         ),
@@ -213,7 +199,7 @@ def initialize_buttons(central_widget, static_elements, dynamic_elements, toggle
             parent_widget=central_widget,
             position=constants_gui.BTN_SLIDER_SET_MAX_COORDINATES,
             size=constants_gui.BTN_SLIDER_SET_MINMAX,
-            on_normal_click=lambda: central_widget.parent().set_slider_value(100),
+            on_normal_click=lambda: instance.set_slider_value(100),
             on_long_click=None,
             invisible=Common.constants.BTN_INVISIBILITY
         ),
@@ -333,6 +319,7 @@ def create_or_stop_pwm_for_bk():
                 duty_cycle=variables.efficiency_BK  
             )
     else:
+            duty_cycle_writer.flush('BK_PWM')
             stop_pwm_signal(variables.BK_PWM)
             variables.BK_PWM = None
 
@@ -348,6 +335,7 @@ def create_or_stop_pwm_for_hlt():
                 duty_cycle=variables.efficiency_HLT  
             )
     else:
+            duty_cycle_writer.flush('HLT_PWM')
             stop_pwm_signal(variables.HLT_PWM)
             variables.HLT_PWM = None
 
@@ -365,6 +353,7 @@ def create_or_stop_pwm_for_p1():
                 variables.P1_PWM.start(variables.pump_speed_P1)
     else:
         if variables.P1_PWM:
+            duty_cycle_writer.flush('P1_PWM')
             stop_pwm_signal(variables.P1_PWM)
             variables.P1_PWM = None
 
@@ -382,9 +371,24 @@ def create_or_stop_pwm_for_p2():
                 variables.P2_PWM.start(variables.pump_speed_P2)
     else:
         if variables.P2_PWM:
+            duty_cycle_writer.flush('P2_PWM')
             stop_pwm_signal(variables.P2_PWM)
             variables.P2_PWM = None
 
+def apply_duty_cycle_changes(changes, version):
+    """
+    State subscriber that drives the PWM outputs from changed duty cycles, whichever thread set them.
+
+    Heater changes are only applied while the total power stays within the limit. The writes
+    go through duty_cycle_writer, so a burst of changes reaches the hardware as one write.
+    """
+    for variable_name, value in changes.items():
+        if variable_name in ['efficiency_BK', 'efficiency_HLT'] and not power_is_within_limit(calculate_new_total_power_consumption(variable_name, value)):
+            continue
+        pwm_name = DUTY_CYCLE_OUTPUTS[variable_name]
+        # Look the handle up at write time; the output may have been switched on or off since the request
+        duty_cycle_writer.request(pwm_name, value, lambda duty_cycle, pwm_name=pwm_name: change_pwm_duty_cycle(getattr(variables, pwm_name), duty_cycle))
+
 def hide_GUI_elements(static_elements, dynamic_elements, buttons):
     """
     Hides specific static images initialized in the static GUI.
@@ -0,0 +1,96 @@
+# brewscreen_presenter.py
+from PyQt5.QtCore import QObject, QTimer
+import Common.constants as constants
+from Common.constants_gui import POT_ON_FOREGROUND_HEIGHT
+
+
+class BrewscreenPresenter(QObject):
+    """
+    Applies thermometer snapshots to the brew screen in the GUI thread.
+
+    Snapshots that arrive before the GUI gets to them are coalesced: every one is
+    added to the temperature history, and the graph (once it has been built) is
+    redrawn once, but the labels, pot fills and temp-reached images are only
+    set from the latest, in one pass with widget updates suspended, so a tick
+    costs at most one repaint. Widgets are only touched when what they show changes.
+    """
+    def __init__(self, central_widget, static_elements, dynamic_elements, temperature_history, graph=None):
+        super().__init__(central_widget)
+        self.central_widget = central_widget
+        self.static_elements = static_elements
+        self.dynamic_elements = dynamic_elements
+        self.temperature_history = temperature_history  # Shared with the graph, which may be built later
+        self.graph = graph
+        self.pending = []  # Snapshots received since the last apply
+        self.shown = {}  # What each widget currently shows, keyed by element name
+
+    def attach_graph(self, graph):
+        """Redraw `graph` whenever samples are added; it must draw from the same temperature history."""
+        self.graph = graph
+
+    def submit(self, snapshot):
+        """Queue a snapshot and schedule a single apply for everything queued so far."""
+        if not self.pending:
+            QTimer.singleShot(0, self.apply)
+        self.pending.append(snapshot)
+
+    def apply(self):
+        """Apply the queued snapshots in one update pass."""
+        snapshots, self.pending = self.pending, []
+        if not snapshots:
+            return
+
+        for snapshot in snapshots:
+            self.temperature_history.append_reading(snapshot.elapsed_time, snapshot.temp_bk, snapshot.temp_mlt, snapshot.temp_hlt)
+        if self.graph is not None:
+            self.graph.refresh()
+
+        latest = snapshots[-1]
+        self.central_widget.setUpdatesEnabled(False)
+        try:
+            self.update_temperature_label('TXT_TEMP_BK', latest.temp_bk)
+            self.update_temperature_label('TXT_TEMP_MLT', latest.temp_mlt)
+            self.update_temperature_label('TXT_TEMP_HLT', latest.temp_hlt)
+
+            self.update_pot_fill('IMG_Pot_BK_On_Foreground', latest.temp_bk, latest.temp_reg_bk)
+            self.update_pot_fill('IMG_Pot_HLT_On_Foreground', latest.temp_hlt, latest.temp_reg_hlt)
+
+            self.update_temp_reached_element('IMG_Pot_BK_On_Temp_Reached', latest.temp_bk, latest.temp_reg_bk, latest.bk_on)
+            self.update_temp_reached_element('IMG_Pot_HLT_On_Temp_Reached', latest.temp_hlt, latest.temp_reg_hlt, latest.hlt_on)
+        finally:
+            self.central_widget.setUpdatesEnabled(True)
+
+    def changed(self, key, value):
+        """Remember what a widget shows and report whether it differs from before. Only for widgets the presenter alone sets."""
+        if self.shown.get(key) == value:
+            return False
+        self.shown[key] = value
+        return True
+
+    def update_temperature_label(self, label_key, temperature):
+        """Show a temperature reading, leaving the label alone on a failed read."""
+        if temperature < 0 or label_key not in self.dynamic_elements:
+            return
+        text = "100°" if temperature >= 100 else f"{temperature:.1f}°"
+        if self.changed(label_key, text):
+            self.dynamic_elements[label_key].setText(text)
+
+    def update_pot_fill(self, image_key, temperature, temp_reg):
+        """Fill the pot foreground up to the temperature's progress towards the setpoint."""
+        if image_key not in self.static_elements:
+            return
+        progress = min(100, max(0, (temperature / temp_reg) * 100)) if temp_reg > 0 else 0
+        self.static_elements[image_key].set_fill(progress, POT_ON_FOREGROUND_HEIGHT)  # No-op when the level is unchanged
+
+    def update_temp_reached_element(self, image_key, temp, temp_reg, state):
+        """Show the temp-reached image while the vessel is on and at its setpoint."""
+        if image_key not in self.static_elements:
+            return
+        if state:
+            visible = (temp >= 100 and temp_reg == 100) or abs(temp - temp_reg) <= constants.TEMP_REACHED_MARGIN
+        else:
+            visible = False
+        # Compare with the widget itself, the on/off toggles also hide these images
+        element = self.static_elements[image_key]
+        if element.isHidden() == visible:
+            element.setVisible(visible)
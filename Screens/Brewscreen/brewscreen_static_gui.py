@@ -1,5 +1,6 @@
 # brewscreen_static_gui.py
 from Common.utils import create_image, create_label
+from Common.pot_fill import PotFill
 import Common.constants_gui as constants_gui
 from PyQt5.QtCore import Qt
 
@@ -19,12 +20,13 @@ def initialize_static_images(parent_widget):
         'IMG_Sidebar_Icon_Graph': create_image(parent_widget, "Icon_Graph.png", center=constants_gui.IMG_SIDEBAR_ICON_GRAPHS),
         'IMG_Sidebar_Icon_Settings': create_image(parent_widget, "Icon_Settings.png", center=constants_gui.IMG_SIDEBAR_ICON_SETTINGS),
         'IMG_Sidebar_Voicelines_Grey': create_image(parent_widget, "Voicelines_Grey.png", center=constants_gui.IMG_VOICELINES),
+        'IMG_Sidebar_Voicelines': create_image(parent_widget, "Voicelines.png", center=constants_gui.IMG_VOICELINES), # Hidden until voice is ready
         'IMG_Sidebar_Konfus_Logo': create_image(parent_widget, "Konfus_Logo.png", center=constants_gui.IMG_KONFUS_LOGO),
 
         # Pots
         'IMG_Pot_BK_Off_Background': create_image(parent_widget, "Pot_Off_Background.png", center=constants_gui.IMG_POT_BK_COORDINATES),
         'IMG_Pot_BK_On_Background': create_image(parent_widget, "Pot_On_Background.png", center=constants_gui.IMG_POT_BK_COORDINATES), # Hidden     
-        'IMG_Pot_BK_On_Foreground': create_image(parent_widget, "Pot_On_Foreground.png", center=constants_gui.IMG_POT_BK_COORDINATES), # Hidden 
+        'IMG_Pot_BK_On_Foreground': PotFill(parent_widget, "Pot_On_Foreground.png", center=constants_gui.IMG_POT_BK_COORDINATES), # Hidden 
         'IMG_Pot_BK_On_Temp_Reached': create_image(parent_widget, "Pot_BK_On_Temp_Reached.png", center=constants_gui.IMG_POT_BK_COORDINATES), # Hidden 
         'IMG_Pot_BK': create_image(parent_widget, "Pot_Outline.png", center=constants_gui.IMG_POT_BK_COORDINATES),
         
@@ -35,7 +37,7 @@ def initialize_static_images(parent_widget):
         
         'IMG_Pot_HLT_Off_Background': create_image(parent_widget, "Pot_Off_Background.png", center=constants_gui.IMG_POT_HLT_COORDINATES),  
         'IMG_Pot_HLT_On_Background': create_image(parent_widget, "Pot_On_Background.png", center=constants_gui.IMG_POT_HLT_COORDINATES), # Hidden     
-        'IMG_Pot_HLT_On_Foreground': create_image(parent_widget, "Pot_On_Foreground.png", center=constants_gui.IMG_POT_HLT_COORDINATES), # Hidden    
+        'IMG_Pot_HLT_On_Foreground': PotFill(parent_widget, "Pot_On_Foreground.png", center=constants_gui.IMG_POT_HLT_COORDINATES), # Hidden    
         'IMG_Pot_HLT_On_Temp_Reached': create_image(parent_widget, "Pot_HLT_On_Temp_Reached.png", center=constants_gui.IMG_POT_HLT_COORDINATES), # Hidden    
         'IMG_Pot_HLT': create_image(parent_widget, "Pot_Outline.png", center=constants_gui.IMG_POT_HLT_COORDINATES),
 
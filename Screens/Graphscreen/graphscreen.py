@@ -2,40 +2,36 @@ import os
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QSlider, QHBoxLayout
 import Common.constants as constants
 from Screens.Graphscreen.graphscreen_gui_initialization import initialize_gui_elements
-from PyQt5.QtCore import Qt
 from Common.TemperatureGraph import TemperatureGraph
 
 class GraphScreen(QWidget):
     """
-    This class represents the graph screen that opens when 'BTN_toggle_sidebar_graphs' is clicked.
+    This class represents the graph screen that is shown when 'BTN_toggle_sidebar_graphs' is clicked.
     """
-    def __init__(self):
-        super().__init__()
+    def __init__(self, screen_manager, temperature_history=None, parent=None):
+        """
+        Parameters:
+        - screen_manager: The ScreenManager used to navigate to the other screens.
+        - temperature_history: The app's TemperatureHistory, so the graph shows samples recorded before it was built.
+        """
+        super().__init__(parent)
         self.path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "Assets"))
+        self.screen_manager = screen_manager
+        self.temperature_history = temperature_history
         self.init_ui()
 
     def init_ui(self):
-        self.setup_window()
         self.setStyleSheet(f"background-color: {constants.BACKGROUND_COLOR};")
         self.setup_layout()  # Use a layout to position the graph and slider
         self.initialize_gui_elements()  # Initialize other GUI elements
 
-    def setup_window(self):
-        self.setGeometry(0, 0, constants.WINDOW_WIDTH, constants.WINDOW_HEIGHT)
-        self.setWindowTitle("Graph Screen")
-        self.showFullScreen()
-
-        from Common.config import IS_RPI
-        if IS_RPI:
-            self.setCursor(Qt.BlankCursor)
-
     def setup_layout(self):
         # Create a vertical layout for the main screen
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(50, 50, 50, 50)  # Adjust margins if needed
 
         # Add the temperature graph to the layout
-        self.temperature_graph = TemperatureGraph(self)
+        self.temperature_graph = TemperatureGraph(self, temperature_history=self.temperature_history)
         self.layout.addWidget(self.temperature_graph)  # Add graph to layout
 
 
@@ -67,11 +63,9 @@ class GraphScreen(QWidget):
         self.temperature_graph.plot_widget.setXRange(*new_range)
 
     def open_settings_screen(self):
-        """
-        Open the settings screen.
+        """Switch to the settings screen."""
+        self.screen_manager.show_screen("settings")
 
-        This method should be connected to functionality that initializes and displays the settings screen.
-        """
-        from Screens.Settingsscreen.settingsscreen import SettingsScreen
-        self.settings_screen = SettingsScreen()
-        self.settings_screen.show()
+    def close_screen(self):
+        """Return to the brew screen."""
+        self.screen_manager.show_screen("brew")
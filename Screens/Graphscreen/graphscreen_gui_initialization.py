@@ -1,8 +1,7 @@
 import Common.constants
 from Screens.Graphscreen.graphscreen_static_gui import initialize_static_elements
-from Common.utils import create_button, set_opacity
+from Common.utils import create_button, connect_voice_icon, set_opacity
 import Common.constants_gui as constants_gui
-from PyQt5.QtCore import QTimer
 from Common.shutdown import perform_shutdown
 
 
@@ -24,6 +23,7 @@ def initialize_gui_elements(parent_widget, assets_path):
     # Explicitly show all elements
     for key, element in parent_widget.static_elements.items():
         element.show()
+    connect_voice_icon(parent_widget.static_elements)
 
     # Initialize buttons
     parent_widget.buttons = initialize_buttons(parent_widget)
@@ -44,7 +44,7 @@ def initialize_buttons(parent_widget):
             parent_widget=parent_widget,
             position=constants_gui.BTN_SIDEBAR_ACTIVE_BUTTON_COORDINATES,  # Example position
             size=constants_gui.BTN_SIDEBAR_MENU,  # Example size
-            on_normal_click=parent_widget.close,  # Close the parent widget
+            on_normal_click=parent_widget.close_screen,  # Return to the brew screen
             on_long_click=None,
             invisible=Common.constants.BTN_INVISIBILITY
         ),
@@ -52,10 +52,7 @@ def initialize_buttons(parent_widget):
             parent_widget=parent_widget,
             position=constants_gui.BTN_SIDEBAR_ACTIVE_BUTTON_SETTINGS_COORDINATES,  # Example position
             size=constants_gui.BTN_SIDEBAR_MENU,  # Example size
-            on_normal_click=lambda: (
-                parent_widget.open_settings_screen(),
-                QTimer.singleShot(100, parent_widget.close)
-            ),         
+            on_normal_click=parent_widget.open_settings_screen,
             on_long_click=None,
             invisible=Common.constants.BTN_INVISIBILITY
         ),
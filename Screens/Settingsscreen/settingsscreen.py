@@ -3,33 +3,27 @@ import os
 from PyQt5.QtWidgets import QWidget, QVBoxLayout
 import Common.constants as constants
 from Screens.Settingsscreen.settingsscreen_gui_initialization import initialize_gui_elements
-from PyQt5.QtCore import Qt
 
 
 class SettingsScreen(QWidget):
     """
-    This class represents the settings screen that opens when 'BTN_toggle_sidebar_settings' is clicked.
+    This class represents the settings screen that is shown when 'BTN_toggle_sidebar_settings' is clicked.
     """
-    def __init__(self):
-        super().__init__()
+    def __init__(self, screen_manager, parent=None):
+        """
+        Parameters:
+        - screen_manager: The ScreenManager used to navigate to the other screens.
+        """
+        super().__init__(parent)
         self.path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "Assets"))
+        self.screen_manager = screen_manager
         self.init_ui()
 
     def init_ui(self):
-        self.setup_window()
         self.setup_layout()
         self.setStyleSheet(f"background-color: {constants.BACKGROUND_COLOR};")
         self.initialize_gui_elements()
 
-    def setup_window(self):
-        self.setGeometry(0, 0, constants.WINDOW_WIDTH, constants.WINDOW_HEIGHT)
-        self.setWindowTitle("Settings screen")
-        self.showFullScreen()
-
-        from Common.config import IS_RPI
-        if (IS_RPI):
-            self.setCursor(Qt.BlankCursor)
-
     def setup_layout(self):
         # Set up a layout for the widget
         self.layout = QVBoxLayout()
@@ -40,6 +34,9 @@ class SettingsScreen(QWidget):
         initialize_gui_elements(self, self.path)
 
     def open_graph_screen(self):
-        from Screens.Graphscreen.graphscreen import GraphScreen
-        self.graph_screen = GraphScreen()  # Instantiate the GraphScreen
-        self.graph_screen.show()  # Show the graph screen
+        """Switch to the graph screen."""
+        self.screen_manager.show_screen("graph")
+
+    def close_screen(self):
+        """Return to the brew screen."""
+        self.screen_manager.show_screen("brew")
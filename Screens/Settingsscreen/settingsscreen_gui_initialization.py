@@ -2,9 +2,8 @@
 import Common.constants
 from Screens.Settingsscreen.settingsscreen_static_gui import initialize_static_elements
 import PyQt5.QtWidgets as QtWidgets
-from Common.utils import create_button
+from Common.utils import create_button, connect_voice_icon
 import Common.constants_gui as constants_gui
-from PyQt5.QtCore import QTimer
 from Common.shutdown import perform_shutdown
 
 def initialize_gui_elements(parent_widget, assets_path):
@@ -24,6 +23,7 @@ def initialize_gui_elements(parent_widget, assets_path):
     # Explicitly show all elements
     for key, element in parent_widget.static_elements.items():
         element.show()
+    connect_voice_icon(parent_widget.static_elements)
 
     # Initialize buttons
     parent_widget.buttons = initialize_buttons(parent_widget)
@@ -44,7 +44,7 @@ def initialize_buttons(parent_widget):
             parent_widget=parent_widget,
             position=constants_gui.BTN_SIDEBAR_ACTIVE_BUTTON_COORDINATES,  # Example position
             size=constants_gui.BTN_SIDEBAR_MENU,  # Example size
-            on_normal_click=parent_widget.close,  # Close the parent widget
+            on_normal_click=parent_widget.close_screen,  # Return to the brew screen
             on_long_click=None,
             invisible=Common.constants.BTN_INVISIBILITY
         ),
@@ -52,10 +52,7 @@ def initialize_buttons(parent_widget):
             parent_widget=parent_widget,
             position=constants_gui.BTN_SIDEBAR_ACTIVE_BUTTON_GRAPHS_COORDINATES,  # Example position
             size=constants_gui.BTN_SIDEBAR_MENU,  # Example size
-            on_normal_click=lambda: (
-                parent_widget.open_graph_screen(),
-                QTimer.singleShot(100, parent_widget.close)
-            ),         
+            on_normal_click=parent_widget.open_graph_screen,
             on_long_click=None,
             invisible=Common.constants.BTN_INVISIBILITY
         ),
@@ -0,0 +1,41 @@
+# screen_manager.py
+from PyQt5.QtWidgets import QStackedWidget
+
+
+class ScreenManager(QStackedWidget):
+    """
+    Switches between the app's screens inside the one full-screen window.
+
+    Each screen is registered with a factory and built the first time it is shown.
+    After that, showing a screen only brings its cached instance to the front, so
+    navigating neither rebuilds widget trees nor leaves closed windows behind.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.factories = {}  # {name: callable returning the screen widget}
+        self.screens = {}  # {name: built screen widget}
+
+    def register(self, name, factory):
+        """Register a screen to be built lazily by `factory` the first time it is shown."""
+        self.factories[name] = factory
+
+    def add_screen(self, name, widget):
+        """Add an already built screen."""
+        self.screens[name] = widget
+        self.addWidget(widget)
+
+    def screen(self, name):
+        """Return the screen called `name`, building it if this is the first time it is needed."""
+        if name not in self.screens:
+            self.add_screen(name, self.factories[name]())
+        return self.screens[name]
+
+    def show_screen(self, name):
+        """Bring the screen called `name` to the front."""
+        self.setCurrentWidget(self.screen(name))
+
+    def current_screen_name(self):
+        for name, widget in self.screens.items():
+            if widget is self.currentWidget():
+                return name
+        return None
@@ -1,29 +1,78 @@
+import time
+STARTUP_TIME = time.perf_counter()  # Reference point for the time-to-first-frame report
+
+# Start decoding the assets on worker threads first, so it overlaps with the imports and setup below
+from Common.asset_cache import preload_assets
+preload_assets()
+
 import os
 import sys
+import threading
 from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QObject, QEvent, QTimer
 from Screens.Brewscreen.brewscreen import FullScreenWindow
-from ChatGPT_API.Vosk_STT import KeywordDetector
 from Common.get_setting import get_setting
+from Common.settings_store import settings_store
+from Common.sound_service import sound_service
 from Common.utils_rpi import initialize_ds18b20_resolution
-from Common.constants_rpi import DS18B20_BK, DS18B20_MLT, DS18B20_HLT
+from Common.constants_rpi import DS18B20_BK, DS18B20_MLT, DS18B20_HLT, DS18B20_DEFAULT_RESOLUTION
 
-def main():
+class FirstFrameReporter(QObject):
+    """Prints the time from startup until a widget is first painted, then runs `on_first_frame` once that frame is done."""
+    def __init__(self, widget, on_first_frame=None):
+        super().__init__(widget)
+        self.widget = widget
+        self.on_first_frame = on_first_frame
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if obj is self.widget and event.type() == QEvent.Paint:
+            self.widget.removeEventFilter(self)
+            print(f"Time to first frame: {(time.perf_counter() - STARTUP_TIME) * 1000:.0f} ms")
+            if self.on_first_frame:
+                QTimer.singleShot(0, self.on_first_frame)
+        return False
+
+
+def start_voice_assistant():
+    """
+    Import and start the keyword detector.
+
+    Runs on a background thread after the first frame, so vosk, sounddevice and openai
+    are not imported (and api_info.env is not read) before the brew screen is up. The
+    Vosk model then loads on the detector's own thread, which lights the voice icon when
+    wake-word detection is live.
+    """
     # Absolute path to the Vosk model
-    model_path = os.path.join(os.path.dirname(__file__), "ChatGPT_API", "vosk-model-small-en-us-0.15")      
+    model_path = os.path.join(os.path.dirname(__file__), "ChatGPT_API", "vosk-model-small-en-us-0.15")
+    try:
+        from ChatGPT_API.Vosk_STT import KeywordDetector
+        detector = KeywordDetector(
+            model_path=model_path,
+            keywords=get_setting("chatGPT_assistant_keywords"),
+        )
+        detector.start_detection()
+    except Exception as e:
+        print(f"Voice assistant unavailable: {e}")
+
+
+def main():
     sensor_codes = [DS18B20_BK, DS18B20_MLT, DS18B20_HLT]
 
     for code in sensor_codes:
-        initialize_ds18b20_resolution(code, resolution="11")
+        initialize_ds18b20_resolution(code, resolution=str(DS18B20_DEFAULT_RESOLUTION))
 
     # Start the PyQt application
     app = QApplication(sys.argv)
+    settings_store.start_watching()  # Apply edits to settings.json while running
     window = FullScreenWindow()
-
-    detector = KeywordDetector(
-        model_path=model_path,
-        keywords=get_setting("chatGPT_assistant_keywords"),
+    FirstFrameReporter(
+        window.central_widget,
+        on_first_frame=lambda: (
+            sound_service.start(),  # Open the audio output and decode the sound bank in the background
+            threading.Thread(target=start_voice_assistant, name="voice-startup", daemon=True).start()
+        )
     )
-    detector.start_detection()
 
     sys.exit(app.exec_())
 